@@ -0,0 +1,134 @@
+"""
+Numba-compiled scoring kernels used by ScoringAgent.
+When Numba is not installed, _NUMBA_AVAILABLE is False and ScoringAgent
+falls back to its pure-NumPy scoring path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below still import without Numba."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+N_FACTORS = 6
+
+
+@njit(cache=True)
+def popcount(mask):
+    """Count set bits of a uint64 (SWAR)."""
+    x = mask - ((mask >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+@njit(cache=True)
+def score_company_size(emp, emp_bands, emp_lut):
+    """Score company size from the employee count via the band edges/scores tables."""
+    return emp_lut[np.searchsorted(emp_bands, emp, side='right')]
+
+
+@njit(cache=True)
+def score_industry(ind_id, target_ids, industry_close):
+    """Score industry fit from an interned industry id."""
+    for target in target_ids:
+        if ind_id == target:
+            return 10.0
+    if industry_close[ind_id]:
+        return 7.0
+    return 3.0
+
+
+@njit(cache=True)
+def score_tech(mask, ideal_mask, compatible_mask):
+    """Score technology compatibility from a technology bitmask."""
+    ideal = popcount(mask & ideal_mask)
+    compatible = popcount(mask & compatible_mask)
+    if ideal >= 2:
+        return 10.0
+    if ideal >= 1 or compatible >= 2:
+        return 7.0
+    if compatible >= 1:
+        return 5.0
+    return 2.0
+
+
+@njit(cache=True)
+def score_signals(mask, high_mask, med_mask):
+    """Score buying signals from a signal bitmask."""
+    high = popcount(mask & high_mask)
+    medium = popcount(mask & med_mask)
+    if high >= 2:
+        return 10.0
+    if high >= 1:
+        return 8.0
+    if medium >= 2:
+        return 6.0
+    if medium >= 1:
+        return 4.0
+    return 2.0
+
+
+@njit(cache=True)
+def score_lead(i, composite, individual, emp, emp_bands, emp_lut, ind_id, target_ids, industry_close, tech_mask,
+               sig_mask, sen_id, fund_id, sen_lut, fund_lut, ideal_mask, compatible_mask, high_mask, med_mask, weights):
+    """Score lead i, writing only row i of the output arrays."""
+    individual[i, 0] = score_company_size(emp[i], emp_bands, emp_lut)
+    individual[i, 1] = score_industry(ind_id[i], target_ids, industry_close)
+    individual[i, 2] = score_tech(tech_mask[i], ideal_mask, compatible_mask)
+    individual[i, 3] = score_signals(sig_mask[i], high_mask, med_mask)
+    individual[i, 4] = sen_lut[sen_id[i]]
+    individual[i, 5] = fund_lut[fund_id[i]]
+
+    total = 0.0
+    for j in range(N_FACTORS):
+        total += individual[i, j] * weights[j]
+    composite[i] = total
+
+
+@njit(cache=True)
+def score_batch(emp, emp_bands, emp_lut, ind_id, target_ids, industry_close, tech_mask, sig_mask, sen_id, fund_id,
+                sen_lut, fund_lut, ideal_mask, compatible_mask, high_mask, med_mask, weights):
+    """
+    Score a batch of leads.
+
+    Returns:
+        Tuple of (composite scores of shape (n,), individual scores of shape (n, 6))
+    """
+    n = emp.shape[0]
+    composite = np.empty(n, dtype=np.float64)
+    individual = np.empty((n, N_FACTORS), dtype=np.float64)
+
+    for i in range(n):
+        score_lead(i, composite, individual, emp, emp_bands, emp_lut, ind_id, target_ids, industry_close, tech_mask,
+                   sig_mask, sen_id, fund_id, sen_lut, fund_lut, ideal_mask, compatible_mask, high_mask, med_mask, weights)
+
+    return composite, individual
+
+
+@njit(parallel=True, cache=True)
+def score_batch_parallel(emp, emp_bands, emp_lut, ind_id, target_ids, industry_close, tech_mask, sig_mask, sen_id,
+                         fund_id, sen_lut, fund_lut, ideal_mask, compatible_mask, high_mask, med_mask, weights):
+    """
+    Multi-threaded score_batch. Leads are independent, so iterations share no state.
+    Thread start-up makes this slower than score_batch for small batches.
+    """
+    n = emp.shape[0]
+    composite = np.empty(n, dtype=np.float64)
+    individual = np.empty((n, N_FACTORS), dtype=np.float64)
+
+    for i in prange(n):
+        score_lead(i, composite, individual, emp, emp_bands, emp_lut, ind_id, target_ids, industry_close, tech_mask,
+                   sig_mask, sen_id, fund_id, sen_lut, fund_lut, ideal_mask, compatible_mask, high_mask, med_mask, weights)
+
+    return composite, individual
@@ -54,7 +54,8 @@ class ProspectSearchAgent(BaseAgent):
             self.logger.warning("Clay API not configured, skipping Clay search")
             return []
         
-        # Mock Clay API implementation (replace with actual API calls)
+        # Mock Clay API implementation (replace with actual API calls, made through one
+        # shared cached session, e.g. requests-cache, so repeat searches skip the API)
         self.logger.info("Searching Clay API for prospects...")
         
         # Simulate API call results
@@ -104,7 +105,8 @@ class ProspectSearchAgent(BaseAgent):
             self.logger.warning("Apollo API not configured, skipping Apollo search")
             return []
         
-        # Mock Apollo API implementation (replace with actual API calls)
+        # Mock Apollo API implementation (replace with actual API calls, made through the
+        # same shared cached session as the Clay search)
         self.logger.info("Searching Apollo API for prospects...")
         
         # Simulate API call results
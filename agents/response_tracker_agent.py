@@ -3,11 +3,30 @@ ResponseTrackerAgent - Tracks email responses and engagement metrics
 """
 
 import json
-import random
+import zlib
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
+
+import numpy as np
+
 from .base_agent import BaseAgent, AgentRegistry
 
+# Candidate values for simulated tracking data, shared across calls
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
+)
+_IP_LOCATIONS = (
+    "San Francisco, CA", "New York, NY", "Austin, TX", "Seattle, WA",
+    "Boston, MA", "Denver, CO", "Atlanta, GA", "Chicago, IL"
+)
+_DEVICE_TYPES = ("desktop", "mobile", "tablet")
+_DEVICE_WEIGHTS = (0.6, 0.35, 0.05)  # Desktop is most common for B2B
+_SENTIMENTS = ('positive', 'neutral', 'negative', 'interested', 'not_interested')
+_SENTIMENT_WEIGHTS = (0.25, 0.35, 0.15, 0.15, 0.10)  # Realistic sentiment distribution
+
 
 @AgentRegistry.register
 class ResponseTrackerAgent(BaseAgent):
@@ -16,6 +35,23 @@ class ResponseTrackerAgent(BaseAgent):
     opens, clicks, replies, and meeting bookings.
     """
 
+    def __init__(self, agent_id: str, config: Dict[str, Any]):
+        """Initialize the ResponseTrackerAgent with an unseeded PCG64 generator."""
+        super().__init__(agent_id, config)
+        self._rng = np.random.default_rng()
+
+    def _seed_rng(self, campaign_id: str):
+        """
+        Reseed the random generator from the campaign ID so simulated
+        engagement is reproducible per campaign.
+
+        Args:
+            campaign_id: Campaign identifier
+        """
+        # crc32 rather than hash(): str hashes are salted per process
+        seed = zlib.crc32(str(campaign_id).encode('utf-8')) & 0xFFFFFFFF
+        self._rng = np.random.default_rng(seed=seed)
+
     def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
         """Validate ResponseTrackerAgent specific inputs."""
         required_fields = ['campaign_id', 'sent_status']
@@ -44,6 +80,9 @@ class ResponseTrackerAgent(BaseAgent):
         """
         engagement_data = []
         
+        # Take the clock reading once; every engagement time is an offset from it
+        now = datetime.now()
+        
         # Simulate realistic engagement rates
         open_rate = 0.35      # 35% open rate
         click_rate = 0.08     # 8% click rate (of opened emails)
@@ -55,10 +94,10 @@ class ResponseTrackerAgent(BaseAgent):
                 continue
             
             # Simulate engagement with realistic probabilities
-            opened = random.random() < open_rate
-            clicked = opened and random.random() < (click_rate / open_rate)  # Only opened emails can be clicked
-            replied = random.random() < reply_rate
-            meeting_booked = replied and random.random() < (meeting_rate / reply_rate)
+            opened = self._rng.random() < open_rate
+            clicked = opened and self._rng.random() < (click_rate / open_rate)  # Only opened emails can be clicked
+            replied = self._rng.random() < reply_rate
+            meeting_booked = replied and self._rng.random() < (meeting_rate / reply_rate)
             
             # Simulate response sentiment for replied emails
             sentiment = self._generate_response_sentiment() if replied else None
@@ -72,9 +111,9 @@ class ResponseTrackerAgent(BaseAgent):
                 'replied': replied,
                 'meeting_booked': meeting_booked,
                 'response_sentiment': sentiment,
-                'open_time': self._generate_engagement_time('open') if opened else None,
-                'click_time': self._generate_engagement_time('click') if clicked else None,
-                'reply_time': self._generate_engagement_time('reply') if replied else None,
+                'open_time': self._generate_engagement_time('open', now) if opened else None,
+                'click_time': self._generate_engagement_time('click', now) if clicked else None,
+                'reply_time': self._generate_engagement_time('reply', now) if replied else None,
                 'tracking_data': {
                     'user_agent': self._generate_user_agent() if opened else None,
                     'ip_location': self._generate_ip_location() if opened else None,
@@ -88,16 +127,15 @@ class ResponseTrackerAgent(BaseAgent):
 
     def _generate_response_sentiment(self) -> str:
         """Generate realistic response sentiment."""
-        sentiments = ['positive', 'neutral', 'negative', 'interested', 'not_interested']
-        weights = [0.25, 0.35, 0.15, 0.15, 0.10]  # Realistic sentiment distribution
-        return random.choices(sentiments, weights=weights)[0]
+        return _SENTIMENTS[self._rng.choice(len(_SENTIMENTS), p=_SENTIMENT_WEIGHTS)]
 
-    def _generate_engagement_time(self, action_type: str) -> str:
+    def _generate_engagement_time(self, action_type: str, now: datetime) -> str:
         """
         Generate realistic engagement timestamps.
         
         Args:
             action_type: Type of engagement ('open', 'click', 'reply')
+            now: Reference time the engagement delay is added to
             
         Returns:
             ISO timestamp string
@@ -105,42 +143,33 @@ class ResponseTrackerAgent(BaseAgent):
         # Generate engagement time within realistic windows
         if action_type == 'open':
             # Opens typically happen within hours to days
-            hours_delay = random.uniform(0.5, 48)
+            hours_delay = self._rng.uniform(0.5, 48)
         elif action_type == 'click':
             # Clicks happen shortly after opens
-            hours_delay = random.uniform(0.1, 2)
+            hours_delay = self._rng.uniform(0.1, 2)
         elif action_type == 'reply':
             # Replies can take longer
-            hours_delay = random.uniform(2, 72)
+            hours_delay = self._rng.uniform(2, 72)
         else:
             hours_delay = 1
         
-        engagement_time = datetime.now() + timedelta(hours=hours_delay)
-        return engagement_time.isoformat()
+        return self._engagement_ts(now, hours_delay)
+
+    def _engagement_ts(self, now: datetime, hours: float) -> str:
+        """Return the ISO timestamp ``hours`` after ``now``."""
+        return (now + timedelta(hours=hours)).isoformat()
 
     def _generate_user_agent(self) -> str:
         """Generate realistic user agent string."""
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
-        ]
-        return random.choice(user_agents)
+        return _USER_AGENTS[self._rng.integers(len(_USER_AGENTS))]
 
     def _generate_ip_location(self) -> str:
         """Generate realistic IP location."""
-        locations = [
-            "San Francisco, CA", "New York, NY", "Austin, TX", "Seattle, WA",
-            "Boston, MA", "Denver, CO", "Atlanta, GA", "Chicago, IL"
-        ]
-        return random.choice(locations)
+        return _IP_LOCATIONS[self._rng.integers(len(_IP_LOCATIONS))]
 
     def _generate_device_type(self) -> str:
         """Generate realistic device type."""
-        devices = ["desktop", "mobile", "tablet"]
-        weights = [0.6, 0.35, 0.05]  # Desktop is most common for B2B
-        return random.choices(devices, weights=weights)[0]
+        return _DEVICE_TYPES[self._rng.choice(len(_DEVICE_TYPES), p=_DEVICE_WEIGHTS)]
 
     def _calculate_metrics(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -212,7 +241,7 @@ class ResponseTrackerAgent(BaseAgent):
             if response['opened'] and response['open_time']:
                 # In a real implementation, calculate actual time difference
                 # For demo, generate sample time difference
-                engagement_times.append(random.uniform(1, 48))  # Hours
+                engagement_times.append(self._rng.uniform(1, 48))  # Hours
         
         avg_time_to_open = sum(engagement_times) / len(engagement_times) if engagement_times else 0
         
@@ -278,6 +307,7 @@ class ResponseTrackerAgent(BaseAgent):
         sent_status = inputs['sent_status']
         
         self.reason(inputs, "analyzing_campaign_engagement")
+        self._seed_rng(campaign_id)
         
         # Filter to only successfully sent emails
         sent_emails = [email for email in sent_status if email['status'] == 'sent']
@@ -2,9 +2,331 @@
 ScoringAgent - Scores and ranks leads based on ICP criteria and buying signals
 """
 
+import bisect
+import heapq
 import json
-from typing import Dict, Any, List, Tuple
+import math
+import operator
+import os
+from datetime import datetime
+from functools import lru_cache, reduce
+from typing import Dict, Any, FrozenSet, Iterable, List, Tuple
+
+import numpy as np
+
 from .base_agent import BaseAgent, AgentRegistry
+from ._scoring_kernels import _NUMBA_AVAILABLE, score_batch, score_batch_parallel
+
+# Canonical column order of the per-factor score matrix
+_FACTOR_ORDER = (
+    'company_size',
+    'industry_match',
+    'technology_stack',
+    'recent_signals',
+    'contact_seniority',
+    'funding_stage'
+)
+
+# Priority labels indexed by the ids ScoringAgent._priority_ids produces
+_PRIORITY_LABELS = ('low', 'medium', 'high')
+
+# Factor weights used when scoring_criteria doesn't override them
+_DEFAULT_WEIGHTS = {
+    'company_size': 0.20,
+    'industry_match': 0.25,
+    'technology_stack': 0.15,
+    'recent_signals': 0.20,
+    'contact_seniority': 0.10,
+    'funding_stage': 0.10
+}
+
+# Employee-count band edges: a count is in band i when _EMP_BANDS[i-1] <= count < _EMP_BANDS[i].
+# 500 and 1000 belong to the band below them, so those edges sit one ulp above.
+# Shared by the reasoning text, the NumPy path and the Numba kernel.
+_EMP_BANDS = (50.0, 100.0, math.nextafter(500.0, math.inf), math.nextafter(1000.0, math.inf))
+_EMP_BAND_EDGES = np.array(_EMP_BANDS, dtype=np.float64)
+_EMP_SCORES = (
+    (4.0, "Small company - may have limited budget"),
+    (8.0, "Good company size fit"),
+    (10.0, "Perfect company size fit for our ICP"),
+    (8.0, "Good company size fit"),
+    (6.0, "Large company - may have longer sales cycles")
+)
+_EMP_LUT = np.array([score for score, _ in _EMP_SCORES])
+
+# Target industries from the ICP, interned to stable ids
+_INDUSTRY_IDS = {'SaaS': 0, 'Technology': 1, 'Financial Services': 2}
+_TARGET_INDUSTRIES = frozenset(_INDUSTRY_IDS)
+_TARGET_INDUSTRIES_LOWER = frozenset(target.lower() for target in _INDUSTRY_IDS)
+_TARGET_INDUSTRY_IDS = np.array(list(_INDUSTRY_IDS.values()), dtype=np.int64)
+
+# Bit assigned to each known technology / buying signal (keys are lowercase)
+TECH_BITS = {
+    'salesforce': 1 << 0,
+    'hubspot': 1 << 1,
+    'aws': 1 << 2,
+    'microsoft 365': 1 << 3,
+    'google cloud': 1 << 4,
+    'slack': 1 << 5,
+    'zoom': 1 << 6,
+    'postgresql': 1 << 7,
+    'mongodb': 1 << 8
+}
+IDEAL_TECH_MASK = reduce(operator.or_, (TECH_BITS[t] for t in ('salesforce', 'hubspot', 'aws', 'microsoft 365')))
+COMPATIBLE_TECH_MASK = reduce(operator.or_, (TECH_BITS[t] for t in ('google cloud', 'slack', 'zoom', 'postgresql', 'mongodb')))
+
+SIGNAL_BITS = {
+    'recent_funding': 1 << 0,
+    'new_leadership': 1 << 1,
+    'hiring_for_sales': 1 << 2,
+    'product_launch': 1 << 3,
+    'expansion': 1 << 4,
+    'hiring': 1 << 5
+}
+HIGH_SIGNAL_MASK = reduce(operator.or_, (SIGNAL_BITS[s] for s in ('recent_funding', 'new_leadership', 'hiring_for_sales')))
+MED_SIGNAL_MASK = reduce(operator.or_, (SIGNAL_BITS[s] for s in ('product_launch', 'expansion', 'hiring')))
+
+# Seniority and funding score tables; row ids index the NumPy lookup arrays
+_SENIORITY_SCORES = {
+    'executive': (10.0, "Executive level - high decision-making power"),
+    'senior': (8.0, "Senior level - significant influence on decisions"),
+    'mid': (6.0, "Mid-level - may influence but needs executive buy-in"),
+    'entry': (3.0, "Entry-level - limited decision-making authority"),
+    'unknown': (4.0, "Unknown seniority level")
+}
+_SENIORITY_IDS = {key: i for i, key in enumerate(_SENIORITY_SCORES)}
+# Same tables keyed on common case variants too, so the hot path can skip .lower()
+_SENIORITY_TABLE = {v: val for k, val in _SENIORITY_SCORES.items() for v in (k, k.upper(), k.title())}
+_SENIORITY_ID_TABLE = {v: i for k, i in _SENIORITY_IDS.items() for v in (k, k.upper(), k.title())}
+_SENIORITY_LUT = np.array([score for score, _ in _SENIORITY_SCORES.values()])
+
+_FUNDING_SCORES = {
+    'series a': (9.0, "Series A - growing with established product-market fit"),
+    'series b': (10.0, "Series B - scaling rapidly with proven revenue model"),
+    'series c': (8.0, "Series C - mature company with substantial resources"),
+    'series c+': (7.0, "Late stage - established but may have complex decision processes"),
+    'seed': (6.0, "Seed stage - early but may have limited budget"),
+    'unknown': (5.0, "Unknown funding stage"),
+}
+_FUNDING_IDS = {key: i for i, key in enumerate(_FUNDING_SCORES)}
+_FUNDING_TABLE = {v: val for k, val in _FUNDING_SCORES.items() for v in (k, k.upper(), k.title())}
+_FUNDING_ID_TABLE = {v: i for k, i in _FUNDING_IDS.items() for v in (k, k.upper(), k.title())}
+_FUNDING_LUT = np.array([score for score, _ in _FUNDING_SCORES.values()])
+
+
+def _encode_mask(items: Iterable[str], table: Dict[str, int]) -> int:
+    """OR together the bits of every known item (case-insensitive)."""
+    return reduce(operator.or_, (table.get(item.lower(), 0) for item in items), 0)
+
+
+def _lookup(table: Dict[str, Any], key: str, default: Any) -> Any:
+    """Look up ``key`` as given, falling back to its lowercase form on a miss."""
+    value = table.get(key)
+    if value is None:
+        value = table.get(key.lower(), default)
+    return value
+
+
+def _is_well_formed(lead: Any) -> bool:
+    """Shape-check a lead so the fast scoring path can index it directly."""
+    if not isinstance(lead, dict):
+        return False
+    
+    company_data = lead.get('company_data')
+    contact_data = lead.get('contact')
+    signals = lead.get('original_signals')
+    if not (isinstance(company_data, dict) and isinstance(contact_data, dict) and isinstance(signals, list)):
+        return False
+    
+    employee_count = company_data.get('employee_count')
+    industry_tags = company_data.get('industry_tags')
+    technologies = company_data.get('technologies')
+    return (
+        isinstance(employee_count, (int, float)) and not isinstance(employee_count, bool)
+        and isinstance(industry_tags, list) and all(isinstance(tag, str) for tag in industry_tags[:1])
+        and isinstance(technologies, list) and all(isinstance(tech, str) for tech in technologies)
+        and all(isinstance(signal, str) for signal in signals)
+        and isinstance(contact_data.get('seniority'), str)
+        and isinstance(company_data.get('funding'), str)
+    )
+
+
+def _partition_leads(enriched_leads: List[Any]) -> Tuple[List[Dict[str, Any]], List[Any]]:
+    """Split leads into (well-formed, malformed) lists, preserving order within each."""
+    valid = []
+    invalid = []
+    for lead in enriched_leads:
+        (valid if _is_well_formed(lead) else invalid).append(lead)
+    return valid, invalid
+
+
+def _bit_count(mask: int) -> int:
+    """Count set bits of an int (int.bit_count needs Python 3.10)."""
+    return bin(mask).count('1')
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Count set bits of each uint64 in ``masks``."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(masks)
+    # SWAR popcount for NumPy < 2.0
+    x = masks - ((masks >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def _company_size_tier(employee_count: float) -> int:
+    """
+    Bucket an employee count into a company size band.
+    
+    Args:
+        employee_count: Number of employees
+        
+    Returns:
+        Index into _EMP_SCORES
+    """
+    return bisect.bisect_right(_EMP_BANDS, employee_count)
+
+
+@lru_cache(maxsize=4096)
+def _score_company_size(tier: int) -> Tuple[float, str]:
+    """
+    Score based on company size alignment with ICP.
+    
+    Args:
+        tier: Company size band from _company_size_tier
+        
+    Returns:
+        Tuple of (score, reasoning)
+    """
+    return _EMP_SCORES[tier]
+
+
+def _is_close_industry(industry_lower: str) -> bool:
+    """Check whether a lowercased industry matches or contains a target industry."""
+    if industry_lower in _TARGET_INDUSTRIES_LOWER:
+        return True
+    return any(target in industry_lower for target in _TARGET_INDUSTRIES_LOWER)
+
+
+@lru_cache(maxsize=4096)
+def _score_industry_match(industry: str) -> Tuple[float, str]:
+    """
+    Score based on industry alignment with the ICP target industries.
+    
+    Args:
+        industry: Company industry
+        
+    Returns:
+        Tuple of (score, reasoning)
+    """
+    if industry in _TARGET_INDUSTRIES:
+        score = 10.0
+        reasoning = f"Perfect industry match - {industry} is a target vertical"
+    elif _is_close_industry(industry.lower()):
+        score = 7.0
+        reasoning = f"Close industry match - {industry} is adjacent to our targets"
+    else:
+        score = 3.0
+        reasoning = f"Industry {industry} is not in our primary targets"
+    
+    return score, reasoning
+
+
+@lru_cache(maxsize=4096)
+def _score_technology_stack(technologies: FrozenSet[str]) -> Tuple[float, str]:
+    """
+    Score based on technology stack compatibility.
+    
+    Args:
+        technologies: Technologies used by the company
+        
+    Returns:
+        Tuple of (score, reasoning)
+    """
+    mask = _encode_mask(technologies, TECH_BITS)
+    
+    ideal_matches = _bit_count(mask & IDEAL_TECH_MASK)
+    compatible_matches = _bit_count(mask & COMPATIBLE_TECH_MASK)
+    
+    if ideal_matches >= 2:
+        score = 10.0
+        reasoning = f"Excellent tech stack compatibility - uses {ideal_matches} ideal technologies"
+    elif ideal_matches >= 1 or compatible_matches >= 2:
+        score = 7.0
+        reasoning = "Good tech stack compatibility"
+    elif compatible_matches >= 1:
+        score = 5.0
+        reasoning = "Some tech stack compatibility"
+    else:
+        score = 2.0
+        reasoning = "Limited tech stack visibility or compatibility"
+    
+    return score, reasoning
+
+
+@lru_cache(maxsize=4096)
+def _score_recent_signals(signals: Tuple[str, ...]) -> Tuple[float, str]:
+    """
+    Score based on buying signals and recent activity.
+    
+    Args:
+        signals: Buying signals, in lead order (kept for the reasoning text)
+        
+    Returns:
+        Tuple of (score, reasoning)
+    """
+    mask = _encode_mask(signals, SIGNAL_BITS)
+    
+    high_matches = _bit_count(mask & HIGH_SIGNAL_MASK)
+    medium_matches = _bit_count(mask & MED_SIGNAL_MASK)
+    
+    if high_matches >= 2:
+        score = 10.0
+        reasoning = f"Multiple high-priority buying signals: {', '.join(signals)}"
+    elif high_matches >= 1:
+        score = 8.0
+        reasoning = f"Strong buying signal present: {', '.join(signals)}"
+    elif medium_matches >= 2:
+        score = 6.0
+        reasoning = f"Multiple medium-priority signals: {', '.join(signals)}"
+    elif medium_matches >= 1:
+        score = 4.0
+        reasoning = f"Some buying signals present: {', '.join(signals)}"
+    else:
+        score = 2.0
+        reasoning = "Limited buying signals detected"
+    
+    return score, reasoning
+
+
+@lru_cache(maxsize=4096)
+def _score_contact_seniority(seniority: str) -> Tuple[float, str]:
+    """
+    Score based on contact seniority and decision-making power.
+    
+    Args:
+        seniority: Contact seniority level
+        
+    Returns:
+        Tuple of (score, reasoning)
+    """
+    return _lookup(_SENIORITY_TABLE, seniority, _SENIORITY_SCORES['unknown'])
+
+
+@lru_cache(maxsize=4096)
+def _score_funding_stage(funding: str) -> Tuple[float, str]:
+    """
+    Score based on company funding stage.
+    
+    Args:
+        funding: Company funding stage
+        
+    Returns:
+        Tuple of (score, reasoning)
+    """
+    return _lookup(_FUNDING_TABLE, funding, _FUNDING_SCORES['unknown'])
 
 
 @AgentRegistry.register
@@ -14,6 +336,26 @@ class ScoringAgent(BaseAgent):
     and company data to prioritize outreach efforts.
     """
 
+    def __init__(self, agent_id: str, config: Dict[str, Any]):
+        """Initialize the ScoringAgent and warm up the JIT scoring kernel."""
+        super().__init__(agent_id, config)
+        
+        # Multi-threaded kernel only pays off for large batches (~1000+ leads)
+        self._kernel = score_batch_parallel if os.getenv('SCORING_PARALLEL') == '1' else score_batch
+        
+        if _NUMBA_AVAILABLE:
+            # Compile (or load from cache) now so the first execute isn't charged for it
+            dummy = {
+                'employee_count': np.zeros(1, dtype=np.float64),
+                'industry_id': np.zeros(1, dtype=np.int64),
+                'industry_close': np.zeros(len(_INDUSTRY_IDS), dtype=bool),
+                'tech_mask': np.zeros(1, dtype=np.uint64),
+                'signal_mask': np.zeros(1, dtype=np.uint64),
+                'seniority_id': np.zeros(1, dtype=np.int64),
+                'funding_id': np.zeros(1, dtype=np.int64)
+            }
+            self._score_batch(dummy, np.zeros(len(_FACTOR_ORDER), dtype=np.float64))
+
     def validate_inputs(self, inputs: Dict[str, Any]) -> bool:
         """Validate ScoringAgent specific inputs."""
         required_fields = ['enriched_leads', 'scoring_criteria']
@@ -29,207 +371,261 @@ class ScoringAgent(BaseAgent):
         
         return super().validate_inputs(inputs)
 
-    def _score_company_size(self, employee_count: int, criteria: Dict[str, Any]) -> Tuple[float, str]:
+    def _build_reasoning(self, lead_fields: Tuple, factor_weights: Tuple[Tuple[str, float], ...]) -> List[str]:
         """
-        Score based on company size alignment with ICP.
+        Build the per-factor reasoning strings for one lead.
         
         Args:
-            employee_count: Number of employees
-            criteria: Scoring criteria configuration
+            lead_fields: Raw fields captured by _vectorize_leads
+            factor_weights: (factor, weight) pairs in _FACTOR_ORDER
             
         Returns:
-            Tuple of (score, reasoning)
+            List of reasoning strings, one per factor
         """
-        # Ideal range scoring
-        if 100 <= employee_count <= 500:
-            score = 10.0
-            reasoning = "Perfect company size fit for our ICP"
-        elif 50 <= employee_count <= 1000:
-            score = 8.0
-            reasoning = "Good company size fit"
-        elif employee_count > 1000:
-            score = 6.0
-            reasoning = "Large company - may have longer sales cycles"
-        else:
-            score = 4.0
-            reasoning = "Small company - may have limited budget"
-        
-        return score, reasoning
+        factor_scores = self._score_factors(lead_fields)
+        reasoning_list = []
+        for factor, weight in factor_weights:
+            score, reasoning = factor_scores[factor]
+            reasoning_list.append(f"{factor}: {score}/10 (weight: {weight}) - {reasoning}")
+        return reasoning_list
 
-    def _score_industry_match(self, industry: str, target_industries: List[str]) -> Tuple[float, str]:
+    def _priority_ids(self, composite_scores: np.ndarray, thresholds: Dict[str, float]) -> np.ndarray:
         """
-        Score based on industry alignment.
+        Determine lead priorities from composite scores and thresholds.
         
-        Args:
-            industry: Company industry
-            target_industries: List of target industries
-            
-        Returns:
-            Tuple of (score, reasoning)
-        """
-        if industry in target_industries:
-            score = 10.0
-            reasoning = f"Perfect industry match - {industry} is a target vertical"
-        elif any(target.lower() in industry.lower() for target in target_industries):
-            score = 7.0
-            reasoning = f"Close industry match - {industry} is adjacent to our targets"
-        else:
-            score = 3.0
-            reasoning = f"Industry {industry} is not in our primary targets"
-        
-        return score, reasoning
-
-    def _score_technology_stack(self, technologies: List[str]) -> Tuple[float, str]:
-        """
-        Score based on technology stack compatibility.
+        The high threshold is checked first, so inverted thresholds (min_score > high_priority)
+        still label every score at or above high_priority as high.
         
         Args:
-            technologies: List of technologies used by the company
+            composite_scores: Composite lead scores
+            thresholds: Score thresholds configuration
             
         Returns:
-            Tuple of (score, reasoning)
+            Array of priority ids indexing _PRIORITY_LABELS (0=low, 1=medium, 2=high)
         """
-        # Define ideal and compatible technologies
-        ideal_tech = {"Salesforce", "HubSpot", "AWS", "Microsoft 365"}
-        compatible_tech = {"Google Cloud", "Slack", "Zoom", "PostgreSQL", "MongoDB"}
-        
-        tech_set = set(tech.lower() for tech in technologies)
-        
-        ideal_matches = len(ideal_tech.intersection(tech_set))
-        compatible_matches = len(compatible_tech.intersection(tech_set))
-        
-        if ideal_matches >= 2:
-            score = 10.0
-            reasoning = f"Excellent tech stack compatibility - uses {ideal_matches} ideal technologies"
-        elif ideal_matches >= 1 or compatible_matches >= 2:
-            score = 7.0
-            reasoning = "Good tech stack compatibility"
-        elif compatible_matches >= 1:
-            score = 5.0
-            reasoning = "Some tech stack compatibility"
-        else:
-            score = 2.0
-            reasoning = "Limited tech stack visibility or compatibility"
-        
-        return score, reasoning
+        high = composite_scores >= thresholds.get('high_priority', 9.0)
+        medium = composite_scores >= thresholds.get('min_score', 7.0)
+        return np.where(high, 2, np.where(medium, 1, 0)).astype(np.int8)
 
-    def _score_recent_signals(self, signals: List[str]) -> Tuple[float, str]:
+    def _encode_lead(self, lead_fields: Tuple, industry_vocab: Dict[str, int]) -> Tuple[Tuple, Tuple]:
         """
-        Score based on buying signals and recent activity.
+        Encode one lead's raw fields into its Struct-of-Arrays row.
         
         Args:
-            signals: List of buying signals
+            lead_fields: (employee_count, industry, technologies, signals, seniority, funding)
+            industry_vocab: Industry -> id interning table, extended in place
             
         Returns:
-            Tuple of (score, reasoning)
+            Tuple of (lead_fields with employee_count coerced to float, row of
+            (employee_count, industry_id, tech_mask, signal_mask, seniority_id, funding_id))
         """
-        # Define signal priorities
-        high_priority_signals = {"recent_funding", "new_leadership", "hiring_for_sales"}
-        medium_priority_signals = {"product_launch", "expansion", "hiring"}
-        
-        high_matches = len(set(signals).intersection(high_priority_signals))
-        medium_matches = len(set(signals).intersection(medium_priority_signals))
-        
-        if high_matches >= 2:
-            score = 10.0
-            reasoning = f"Multiple high-priority buying signals: {', '.join(signals)}"
-        elif high_matches >= 1:
-            score = 8.0
-            reasoning = f"Strong buying signal present: {', '.join(signals)}"
-        elif medium_matches >= 2:
-            score = 6.0
-            reasoning = f"Multiple medium-priority signals: {', '.join(signals)}"
-        elif medium_matches >= 1:
-            score = 4.0
-            reasoning = f"Some buying signals present: {', '.join(signals)}"
-        else:
-            score = 2.0
-            reasoning = "Limited buying signals detected"
-        
-        return score, reasoning
+        employee_count, industry, technologies, signals, seniority, funding = lead_fields
+        # Industries are lowercased when the vocabulary is scored, after the per-lead error handling
+        if not isinstance(industry, str):
+            raise TypeError(f"industry must be a string, not {type(industry).__name__}")
+        # Coerce once so reasoning scores the same number the batch kernel does
+        employee_count = float(employee_count)
+        lead_fields = (employee_count, industry, technologies, signals, seniority, funding)
+        return lead_fields, (
+            employee_count,
+            industry_vocab.setdefault(industry, len(industry_vocab)),
+            _encode_mask(technologies, TECH_BITS),
+            _encode_mask(signals, SIGNAL_BITS),
+            _lookup(_SENIORITY_ID_TABLE, seniority, _SENIORITY_IDS['unknown']),
+            _lookup(_FUNDING_ID_TABLE, funding, _FUNDING_IDS['unknown'])
+        )
 
-    def _score_contact_seniority(self, seniority: str) -> Tuple[float, str]:
+    def _vectorize_leads(self, enriched_leads: List[Dict[str, Any]]) -> Tuple[
+            Dict[str, np.ndarray], List[Dict[str, Any]], List[Tuple], List[Tuple[Dict[str, Any], str]]]:
         """
-        Score based on contact seniority and decision-making power.
+        Convert leads into Struct-of-Arrays form for vectorized scoring.
+        
+        Well-formed leads take a fast path with direct indexing; the rest go
+        through defensive lookups and are reported as failures if unreadable.
         
         Args:
-            seniority: Contact seniority level
+            enriched_leads: List of enriched lead dictionaries
             
         Returns:
-            Tuple of (score, reasoning)
+            Tuple of (arrays keyed by field, leads that were converted, the raw
+            per-lead fields used for reasoning, (lead, error) pairs for leads
+            that could not be read)
         """
-        seniority_scores = {
-            'executive': (10.0, "Executive level - high decision-making power"),
-            'senior': (8.0, "Senior level - significant influence on decisions"),
-            'mid': (6.0, "Mid-level - may influence but needs executive buy-in"),
-            'entry': (3.0, "Entry-level - limited decision-making authority"),
-            'unknown': (4.0, "Unknown seniority level")
+        valid, invalid = _partition_leads(enriched_leads)
+        
+        rows = []
+        valid_leads = []
+        fields = []
+        failed = []
+        industry_vocab = dict(_INDUSTRY_IDS)
+        
+        # Hot path: shape already checked, so no exception handling needed
+        for lead in valid:
+            company_data = lead['company_data']
+            industry_tags = company_data['industry_tags']
+            lead_fields = (
+                company_data['employee_count'],
+                industry_tags[0] if industry_tags else '',
+                company_data['technologies'],
+                lead['original_signals'],
+                lead['contact']['seniority'],
+                company_data['funding']
+            )
+            lead_fields, row = self._encode_lead(lead_fields, industry_vocab)
+            rows.append(row)
+            valid_leads.append(lead)
+            fields.append(lead_fields)
+        
+        # Cold path: malformed leads keep the defensive lookups
+        for lead in invalid:
+            try:
+                company_data = lead.get('company_data', {})
+                contact_data = lead.get('contact', {})
+                lead_fields = (
+                    company_data.get('employee_count', 0),
+                    company_data.get('industry_tags', [''])[0] if company_data.get('industry_tags') else '',
+                    company_data.get('technologies', []),
+                    lead.get('original_signals', []),
+                    contact_data.get('seniority', 'unknown'),
+                    company_data.get('funding', 'unknown')
+                )
+                lead_fields, row = self._encode_lead(lead_fields, industry_vocab)
+            except Exception as e:
+                failed.append((lead, str(e)))
+                continue
+            
+            rows.append(row)
+            valid_leads.append(lead)
+            fields.append(lead_fields)
+        
+        columns = list(zip(*rows)) if rows else [()] * 6
+        
+        # Close (substring) industry matches are resolved once per distinct industry
+        industry_close = np.array([_is_close_industry(name.lower()) for name in industry_vocab], dtype=bool)
+        
+        soa = {
+            'employee_count': np.array(columns[0], dtype=np.float64),
+            'industry_id': np.array(columns[1], dtype=np.int64),
+            'industry_close': industry_close,
+            'tech_mask': np.array(columns[2], dtype=np.uint64),
+            'signal_mask': np.array(columns[3], dtype=np.uint64),
+            'seniority_id': np.array(columns[4], dtype=np.int64),
+            'funding_id': np.array(columns[5], dtype=np.int64)
         }
         
-        return seniority_scores.get(seniority.lower(), (4.0, "Unknown seniority level"))
+        return soa, valid_leads, fields, failed
 
-    def _score_funding_stage(self, funding: str) -> Tuple[float, str]:
+    def _score_matrix(self, soa: Dict[str, np.ndarray]) -> np.ndarray:
         """
-        Score based on company funding stage.
+        Compute every per-factor score for every lead in one vectorized pass.
         
         Args:
-            funding: Company funding stage
+            soa: Struct-of-Arrays lead data from _vectorize_leads
             
         Returns:
-            Tuple of (score, reasoning)
+            Array of shape (n_leads, 6) with columns in _FACTOR_ORDER
         """
-        funding_scores = {
-            'series a': (9.0, "Series A - growing with established product-market fit"),
-            'series b': (10.0, "Series B - scaling rapidly with proven revenue model"),
-            'series c': (8.0, "Series C - mature company with substantial resources"),
-            'series c+': (7.0, "Late stage - established but may have complex decision processes"),
-            'seed': (6.0, "Seed stage - early but may have limited budget"),
-            'unknown': (5.0, "Unknown funding stage"),
-        }
-        
-        return funding_scores.get(funding.lower(), (5.0, "Unknown funding stage"))
+        company_size = _EMP_LUT[np.searchsorted(_EMP_BAND_EDGES, soa['employee_count'], side='right')]
+        
+        ind_id = soa['industry_id']
+        industry_match = np.select(
+            [np.isin(ind_id, _TARGET_INDUSTRY_IDS), soa['industry_close'][ind_id]],
+            [10.0, 7.0],
+            default=3.0
+        )
+        
+        tech_mask = soa['tech_mask']
+        ideal = _popcount(tech_mask & np.uint64(IDEAL_TECH_MASK))
+        compatible = _popcount(tech_mask & np.uint64(COMPATIBLE_TECH_MASK))
+        technology_stack = np.select(
+            [ideal >= 2, (ideal >= 1) | (compatible >= 2), compatible >= 1],
+            [10.0, 7.0, 5.0],
+            default=2.0
+        )
+        
+        signal_mask = soa['signal_mask']
+        high = _popcount(signal_mask & np.uint64(HIGH_SIGNAL_MASK))
+        medium = _popcount(signal_mask & np.uint64(MED_SIGNAL_MASK))
+        recent_signals = np.select(
+            [high >= 2, high >= 1, medium >= 2, medium >= 1],
+            [10.0, 8.0, 6.0, 4.0],
+            default=2.0
+        )
+        
+        contact_seniority = _SENIORITY_LUT[soa['seniority_id']]
+        funding_stage = _FUNDING_LUT[soa['funding_id']]
+        
+        return np.column_stack([
+            company_size,
+            industry_match,
+            technology_stack,
+            recent_signals,
+            contact_seniority,
+            funding_stage
+        ]).astype(np.float64)
 
-    def _calculate_composite_score(self, scores: Dict[str, Tuple[float, str]], 
-                                 weights: Dict[str, float]) -> Tuple[float, List[str]]:
+    def _score_batch(self, soa: Dict[str, np.ndarray],
+                     weights_vector: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculate weighted composite score.
+        Score a Struct-of-Arrays batch, using the Numba kernel when available.
         
         Args:
-            scores: Dictionary of individual scores
-            weights: Scoring weights configuration
+            soa: Struct-of-Arrays lead data from _vectorize_leads
+            weights_vector: Factor weights in _FACTOR_ORDER
             
         Returns:
-            Tuple of (composite_score, reasoning_list)
+            Tuple of (composite scores, individual score matrix)
         """
-        composite_score = 0.0
-        reasoning_list = []
-        
-        # Calculate weighted score
-        for factor, (score, reasoning) in scores.items():
-            weight = weights.get(factor, 0.0)
-            weighted_score = score * weight
-            composite_score += weighted_score
-            reasoning_list.append(f"{factor}: {score}/10 (weight: {weight}) - {reasoning}")
-        
-        return composite_score, reasoning_list
+        if not _NUMBA_AVAILABLE:
+            individual = self._score_matrix(soa)
+            # Accumulate factor by factor in _FACTOR_ORDER (not a matmul) so the
+            # rounding, and so scores sitting exactly on a threshold, match the kernel
+            composite = np.zeros(individual.shape[0], dtype=np.float64)
+            for j, weight in enumerate(weights_vector.tolist()):
+                composite += individual[:, j] * weight
+            return composite, individual
+        
+        return self._kernel(
+            soa['employee_count'],
+            _EMP_BAND_EDGES,
+            _EMP_LUT,
+            soa['industry_id'],
+            _TARGET_INDUSTRY_IDS,
+            soa['industry_close'],
+            soa['tech_mask'],
+            soa['signal_mask'],
+            soa['seniority_id'],
+            soa['funding_id'],
+            _SENIORITY_LUT,
+            _FUNDING_LUT,
+            np.uint64(IDEAL_TECH_MASK),
+            np.uint64(COMPATIBLE_TECH_MASK),
+            np.uint64(HIGH_SIGNAL_MASK),
+            np.uint64(MED_SIGNAL_MASK),
+            weights_vector
+        )
 
-    def _determine_priority(self, score: float, thresholds: Dict[str, float]) -> str:
+    def _score_factors(self, lead_fields: Tuple) -> Dict[str, Tuple[float, str]]:
         """
-        Determine lead priority based on score and thresholds.
+        Score a single lead factor by factor, keeping the reasoning text.
         
         Args:
-            score: Composite lead score
-            thresholds: Score thresholds configuration
+            lead_fields: Raw fields captured by _vectorize_leads
             
         Returns:
-            Priority level string
+            Dictionary of factor -> (score, reasoning)
         """
-        if score >= thresholds.get('high_priority', 9.0):
-            return 'high'
-        elif score >= thresholds.get('min_score', 7.0):
-            return 'medium'
-        else:
-            return 'low'
+        employee_count, industry, technologies, signals, seniority, funding = lead_fields
+        
+        # Memoized helpers need hashable keys
+        return {
+            'company_size': _score_company_size(_company_size_tier(employee_count)),
+            'industry_match': _score_industry_match(industry),
+            'technology_stack': _score_technology_stack(frozenset(technologies)),
+            'recent_signals': _score_recent_signals(tuple(signals)),
+            'contact_seniority': _score_contact_seniority(seniority),
+            'funding_stage': _score_funding_stage(funding)
+        }
 
     def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -237,6 +633,7 @@ class ScoringAgent(BaseAgent):
         
         Args:
             inputs: Dictionary containing enriched_leads and scoring_criteria
+                (scoring_criteria may set top_k to keep only the K best leads)
             
         Returns:
             Dictionary containing ranked leads with scores
@@ -249,110 +646,79 @@ class ScoringAgent(BaseAgent):
         
         self.reason(inputs, "analyzing_leads_for_scoring")
         
+        # Weights are lead-independent: resolve them once, in score-column order
+        effective_weights = {**_DEFAULT_WEIGHTS, **weights}
+        factor_weights = tuple((factor, effective_weights[factor]) for factor in _FACTOR_ORDER)
+        weights_vector = np.array([weight for _, weight in factor_weights], dtype=np.float64)
+        
+        # Score all readable leads at once
+        soa, valid_leads, fields, failed = self._vectorize_leads(enriched_leads)
+        composite_scores, individual = self._score_batch(soa, weights_vector)
+        
+        # Every lead in the batch shares one scoring timestamp
+        batch_ts = datetime.now().isoformat()
         ranked_leads = []
         
-        for lead in enriched_leads:
-            try:
-                company_data = lead.get('company_data', {})
-                contact_data = lead.get('contact', {})
-                signals = lead.get('original_signals', [])
-                
-                # Calculate individual scores
-                scores = {}
-                
-                # Company size score
-                scores['company_size'] = self._score_company_size(
-                    company_data.get('employee_count', 0), 
-                    scoring_criteria
-                )
-                
-                # Industry match score
-                scores['industry_match'] = self._score_industry_match(
-                    company_data.get('industry_tags', [''])[0] if company_data.get('industry_tags') else '',
-                    ['SaaS', 'Technology', 'Financial Services']  # From ICP
-                )
-                
-                # Technology stack score
-                scores['technology_stack'] = self._score_technology_stack(
-                    company_data.get('technologies', [])
-                )
-                
-                # Recent signals score
-                scores['recent_signals'] = self._score_recent_signals(signals)
-                
-                # Bonus factors
-                scores['contact_seniority'] = self._score_contact_seniority(
-                    contact_data.get('seniority', 'unknown')
-                )
-                
-                scores['funding_stage'] = self._score_funding_stage(
-                    company_data.get('funding', 'unknown')
-                )
-                
-                # Calculate composite score
-                # Default weights if not provided
-                default_weights = {
-                    'company_size': 0.20,
-                    'industry_match': 0.25, 
-                    'technology_stack': 0.15,
-                    'recent_signals': 0.20,
-                    'contact_seniority': 0.10,
-                    'funding_stage': 0.10
-                }
-                effective_weights = {**default_weights, **weights}
-                composite_score, reasoning_list = self._calculate_composite_score(scores, effective_weights)
-                
-                # Determine priority
-                priority = self._determine_priority(composite_score, thresholds)
-                
-                # Create scored lead
-                scored_lead = {
-                    'lead': lead,
-                    'score': round(composite_score, 2),
-                    'priority': priority,
-                    'reasoning': reasoning_list,
-                    'individual_scores': {k: v[0] for k, v in scores.items()},
-                    'scoring_timestamp': self._get_timestamp()
-                }
-                
-                ranked_leads.append(scored_lead)
-                self.logger.info(f"Scored {lead.get('company', 'Unknown')}: {composite_score:.2f} ({priority})")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to score lead {lead.get('company', 'Unknown')}: {str(e)}")
-                # Add with minimal score
-                ranked_leads.append({
-                    'lead': lead,
-                    'score': 0.0,
-                    'priority': 'low',
-                    'reasoning': [f"Scoring error: {str(e)}"],
-                    'individual_scores': {},
-                    'scoring_error': str(e),
-                    'scoring_timestamp': self._get_timestamp()
-                })
-        
-        # Sort by score (highest first)
-        ranked_leads.sort(key=lambda x: x['score'], reverse=True)
+        # Priorities as 0=low, 1=medium, 2=high in one pass over the composite scores
+        priority_ids = self._priority_ids(composite_scores, thresholds)
+        
+        for lead, lead_fields, row, composite_score, priority_id in zip(
+                valid_leads, fields, individual.tolist(), composite_scores.tolist(), priority_ids.tolist()):
+            priority = _PRIORITY_LABELS[priority_id]
+            
+            # Reasoning text is only built for leads that will be worked
+            reasoning_list = self._build_reasoning(lead_fields, factor_weights) if priority != 'low' else []
+            
+            # Create scored lead
+            scored_lead = {
+                'lead': lead,
+                'score': round(composite_score, 2),
+                'priority': priority,
+                'reasoning': reasoning_list,
+                'individual_scores': dict(zip(_FACTOR_ORDER, row)),
+                'scoring_timestamp': batch_ts
+            }
+            
+            ranked_leads.append(scored_lead)
+            self.logger.info("Scored %s: %.2f (%s)", lead.get('company', 'Unknown'), composite_score, priority)
+        
+        for lead, error in failed:
+            self.logger.error("Failed to score lead %s: %s", lead.get('company', 'Unknown'), error)
+            # Add with minimal score
+            ranked_leads.append({
+                'lead': lead,
+                'score': 0.0,
+                'priority': 'low',
+                'reasoning': [f"Scoring error: {error}"],
+                'individual_scores': {},
+                'scoring_error': error,
+                'scoring_timestamp': batch_ts
+            })
+        
+        # Priority distribution and average score straight from the arrays;
+        # leads that failed to score count as low priority with a score of 0
+        low, medium, high = np.bincount(priority_ids, minlength=3).tolist()
+        counts = {'high': high, 'medium': medium, 'low': low + len(failed)}
+        total_scored = len(ranked_leads)
+        average_score = float(composite_scores.sum()) / total_scored if ranked_leads else 0
+        
+        # Sort by score (highest first); only select the top K when a cut-off is configured
+        top_k = scoring_criteria.get('top_k')
+        if top_k is not None:
+            ranked_leads = heapq.nlargest(top_k, ranked_leads, key=operator.itemgetter('score'))
+        else:
+            ranked_leads.sort(key=operator.itemgetter('score'), reverse=True)
         
         self.reason({
-            "total_scored": len(ranked_leads),
-            "high_priority": len([l for l in ranked_leads if l['priority'] == 'high']),
-            "medium_priority": len([l for l in ranked_leads if l['priority'] == 'medium']),
-            "low_priority": len([l for l in ranked_leads if l['priority'] == 'low'])
+            "total_scored": total_scored,
+            "high_priority": counts['high'],
+            "medium_priority": counts['medium'],
+            "low_priority": counts['low']
         }, "scoring_complete")
         
         return {
             "ranked_leads": ranked_leads,
-            "total_scored": len(ranked_leads),
-            "priority_distribution": {
-                "high": len([l for l in ranked_leads if l['priority'] == 'high']),
-                "medium": len([l for l in ranked_leads if l['priority'] == 'medium']),
-                "low": len([l for l in ranked_leads if l['priority'] == 'low'])
-            },
-            "average_score": sum(l['score'] for l in ranked_leads) / len(ranked_leads) if ranked_leads else 0
-        }
-
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.now().isoformat()
\ No newline at end of file
+            "total_scored": total_scored,
+            "priority_distribution": counts,
+            "average_score": average_score
+        }
\ No newline at end of file
@@ -2,6 +2,6 @@
 Configuration module for the Prospect to Lead Workflow.
 """
 
-from .env_loader import load_environment, validate_api_keys
+from .env_loader import load_environment, validate_api_keys, invalidate_env_cache
 
-__all__ = ['load_environment', 'validate_api_keys']
\ No newline at end of file
+__all__ = ['load_environment', 'validate_api_keys', 'invalidate_env_cache']
\ No newline at end of file
@@ -4,31 +4,36 @@ Handles loading and validation of environment variables.
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+# API keys and credentials read from the environment
+_API_KEY_NAMES = (
+    'CLAY_API_KEY',
+    'APOLLO_API_KEY',
+    'EXPLORIUM_API_KEY',
+    'GEMINI_API_KEY',
+    'SENDGRID_API_KEY',
+    'SENDER_EMAIL',
+    'GOOGLE_SHEET_ID',
+    'GOOGLE_CREDENTIALS_PATH'
+)
 
-def load_environment() -> Dict[str, Any]:
+
+@lru_cache(maxsize=1)
+def _load_environment_cached() -> Dict[str, Any]:
     """
-    Load environment variables from .env file.
+    Read the .env file and environment variables once per process.
     
     Returns:
-        Dictionary containing environment configuration
+        Dictionary containing environment configuration (shared, do not mutate)
     """
     # Load .env file
     load_dotenv()
     
     # API Keys
-    api_keys = {
-        'CLAY_API_KEY': os.getenv('CLAY_API_KEY'),
-        'APOLLO_API_KEY': os.getenv('APOLLO_API_KEY'), 
-        'EXPLORIUM_API_KEY': os.getenv('EXPLORIUM_API_KEY'),
-        'GEMINI_API_KEY': os.getenv('GEMINI_API_KEY'),
-        'SENDGRID_API_KEY': os.getenv('SENDGRID_API_KEY'),
-        'SENDER_EMAIL': os.getenv('SENDER_EMAIL'),
-        'GOOGLE_SHEET_ID': os.getenv('GOOGLE_SHEET_ID'),
-        'GOOGLE_CREDENTIALS_PATH': os.getenv('GOOGLE_CREDENTIALS_PATH')
-    }
+    api_keys = {key: os.getenv(key) for key in _API_KEY_NAMES}
     
     # Configuration settings
     config = {
@@ -47,6 +52,29 @@ def load_environment() -> Dict[str, Any]:
     }
 
 
+def load_environment() -> Dict[str, Any]:
+    """
+    Load environment variables from .env file.
+    
+    The .env file is parsed on the first call only; later calls return a
+    fresh copy of the cached configuration. Use invalidate_env_cache() to
+    force a re-read.
+    
+    Returns:
+        Dictionary containing environment configuration
+    """
+    env = _load_environment_cached()
+    return {
+        'api_keys': dict(env['api_keys']),
+        'config': dict(env['config'])
+    }
+
+
+def invalidate_env_cache():
+    """Drop the cached environment so the next load re-reads .env."""
+    _load_environment_cached.cache_clear()
+
+
 def validate_api_keys() -> Dict[str, bool]:
     """
     Validate which API keys are available.
@@ -54,14 +82,10 @@ def validate_api_keys() -> Dict[str, bool]:
     Returns:
         Dictionary showing which API keys are configured
     """
-    env = load_environment()
-    api_keys = env['api_keys']
-    
-    validation = {}
-    for key, value in api_keys.items():
-        validation[key] = bool(value and value != f'your_{key.lower()}_here' and not value.startswith('your_'))
+    api_keys = _load_environment_cached()['api_keys']
     
-    return validation
+    # Template placeholders all look like 'your_<key>_here'
+    return {key: bool(value and not value.startswith('your_')) for key, value in api_keys.items()}
 
 
 if __name__ == "__main__":
@@ -3,21 +3,33 @@ Flask Web Dashboard for Prospect to Lead Workflow
 Provides real-time monitoring and control interface
 """
 
-from flask import Flask, render_template, jsonify, request, redirect, url_for
+from flask import Flask, Response, render_template, jsonify, request, redirect, url_for
 from flask_cors import CORS
+import gzip
 import json
+import mmap
 import os
+import re
 import sys
 import threading
 import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 import subprocess
 
+# Fast JSON encoding/decoding (optional - falls back to Flask's JSON provider / json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    loads_json = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    loads_json = json.loads
+
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from langgraph_builder import LangGraphWorkflowBuilder
-
 app = Flask(__name__)
 CORS(app)
 
@@ -36,62 +48,271 @@ workflow_status = {
 workflow_thread = None
 workflow_builder = None
 
+# Stop signal for the current run; each run gets a fresh event
+_stop_event = threading.Event()
+
+# Agent instances reused across dashboard runs (see LangGraphWorkflowBuilder._get_agent)
+_agent_cache = {}
+
+# Builder reused across dashboard runs, and the workflow.json mtime it was built from.
+# _builder_lock is held by the run using it.
+_cached_builder = None
+_cached_builder_mtime = None
+_builder_lock = threading.Lock()
+
+WORKFLOW_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'workflow.json')
+
+# Logs that parse_results_from_logs reads; their mtimes key the /api/results cache
+LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+RESULT_LOGS = ('prospect_search.log', 'scoring.log', 'outreach_content.log', 'send.log')
+
+# Serialized /api/results body for the current results_cache_key(). _results_generation
+# is bumped on every invalidation, so a body built from an older snapshot is never reused.
+# Both are guarded by _status_lock.
+_results_cache = {}
+_results_generation = 0
+
+# Block size used when reading log tails backwards from the end of the file
+LOG_TAIL_BLOCK = 8192
+
+# Result counters scraped from agent logs, as (literal prefix, pattern)
+_TOTAL_FOUND = (b'"total_found":', re.compile(rb'"total_found":\s*(\d+)'))
+_SCORE = (b'"score":', re.compile(rb'"score":\s*(\d+\.\d+)'))
+_SUCCESSFUL_GENERATIONS = (b'"successful_generations":', re.compile(rb'"successful_generations":\s*(\d+)'))
+_SUCCESSFUL_SENDS = (b'"successful_sends":', re.compile(rb'"successful_sends":\s*(\d+)'))
+
+# Read buffer for scanning appended log lines
+LOG_READ_BUFFER = 1 << 20
+
+# Leading bytes kept per cursor to spot a log rewritten in place
+LOG_HEAD_BYTES = 256
+
+# Incremental scan state for last_log_matches:
+# (path, prefix) -> (offset, recent captures, (st_dev, st_ino), first bytes of the file)
+_log_cursors = {}
+_log_cursors_lock = threading.Lock()
+
+# Seconds between keep-alive comments on an idle /api/events stream
+EVENTS_KEEPALIVE = 15
+
+# Guards workflow_status; _status_version is bumped on every change and
+# /api/events subscribers wait on _status_changed for it
+_status_lock = threading.Lock()
+_status_changed = threading.Condition(_status_lock)
+_status_version = 0
+
+@lru_cache(maxsize=16)
+def _load_json_file(path, mtime_ns):
+    """Parse a JSON file. Keyed on mtime so each version of the file is parsed once."""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+def _cached_json(path):
+    """Load a JSON file, only re-reading it when it has changed on disk."""
+    return _load_json_file(path, os.stat(path).st_mtime_ns)
+
+@lru_cache(maxsize=16)
+def _encoded_json_file(path, mtime_ns):
+    """Re-encoded JSON file contents, ready to send. Keyed like _load_json_file."""
+    return dumps_json(_load_json_file(path, mtime_ns))
+
+def dumps_json(obj):
+    """Serialize obj to JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson doesn't handle (e.g. >64-bit ints) go through Flask's provider
+            pass
+    return app.json.dumps(obj).encode('utf-8')
+
+def fast_json(obj, status=200):
+    """jsonify replacement for frequently polled endpoints."""
+    return app.response_class(dumps_json(obj), status=status, mimetype='application/json')
+
+@lru_cache(maxsize=1)
+def _environment_status():
+    """
+    Validate API keys once per process.
+    
+    config.env_loader reads .env only once per process as well, so restart the
+    dashboard to pick up edited keys.
+    """
+    from config.env_loader import validate_api_keys
+    return validate_api_keys()
+
 def load_workflow_config():
     """Load the workflow configuration."""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'workflow.json')
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _cached_json(WORKFLOW_CONFIG_PATH)
     except Exception as e:
         return {'error': f'Failed to load config: {str(e)}'}
 
 def load_environment_status():
     """Check API key configuration status."""
     try:
-        from config.env_loader import validate_api_keys
-        return validate_api_keys()
+        return _environment_status()
     except Exception as e:
         return {'error': f'Failed to check environment: {str(e)}'}
 
+def get_log_path(agent_name):
+    """Path of an agent's log file."""
+    return os.path.join(LOG_DIR, f'{agent_name}.log')
+
+def tail_lines(path, lines):
+    """Return the last `lines` lines of a file, reading blocks backwards from EOF."""
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        # One extra newline guarantees the first kept line is complete
+        while pos > 0 and newlines <= lines:
+            size = min(LOG_TAIL_BLOCK, pos)
+            pos -= size
+            f.seek(pos)
+            block = f.read(size)
+            newlines += block.count(b'\n')
+            blocks.append(block)
+    
+    text = b''.join(reversed(blocks)).decode('utf-8', errors='replace')
+    parts = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    lines_list = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines_list.append(parts[-1])
+    return lines_list[-lines:]
+
 def get_recent_logs(agent_name, lines=20):
     """Get recent logs for an agent."""
-    log_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs', f'{agent_name}.log')
+    log_file = get_log_path(agent_name)
     try:
         if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                lines_list = f.readlines()
-                return lines_list[-lines:] if len(lines_list) > lines else lines_list
+            return tail_lines(log_file, lines)
         return []
     except Exception:
         return []
 
-def run_workflow_background():
-    """Run the workflow in a background thread."""
-    global workflow_status, workflow_builder
+def _invalidate_results_locked():
+    """Drop the cached /api/results body. Caller must hold _status_lock."""
+    global _results_generation
+    _results_generation += 1
+    _results_cache.clear()
+
+def _publish_locked():
+    """Notify /api/events subscribers of a change. Caller must hold _status_lock."""
+    global _status_version
+    _status_version += 1
+    _status_changed.notify_all()
+
+def _snapshot_locked():
+    """Copy of workflow_status. Caller must hold _status_lock."""
+    return {**workflow_status, 'errors': list(workflow_status['errors'])}
+
+def snapshot_status():
+    """Consistent copy of workflow_status for serializing outside the lock."""
+    with _status_lock:
+        return _snapshot_locked()
+
+def _owns_status_locked(stop_event):
+    """
+    Whether the run with this stop_event is still the current one. Caller must hold _status_lock.
+    
+    /api/start replaces _stop_event under the same lock, so a stopped run that is
+    still winding down can't race a newer run's status.
+    """
+    return stop_event is _stop_event
+
+def update_run_status(stop_event, active_only=False, **changes):
+    """
+    Atomically apply workflow_status changes from the worker of the run owning stop_event.
+    
+    Ignored once a newer run has started and, with active_only, once this run
+    was stopped (/api/stop sets the event under _status_lock).
+    """
+    with _status_lock:
+        if not _owns_status_locked(stop_event) or (active_only and stop_event.is_set()):
+            return
+        workflow_status.update(changes)
+        _publish_locked()
+
+def step_progress(summary):
+    """Progress status changes from the builder's execution summary after each step."""
+    total_steps = summary.get('total_steps', 7)
+    executed_steps = summary.get('executed_steps', 0)
+    return {
+        'progress': int((executed_steps / total_steps) * 100) if total_steps > 0 else 0,
+        'current_step': summary.get('current_step', 'unknown')
+    }
+
+def execute_workflow(on_step, stop_event):
+    """
+    Run the workflow on the cached builder, reloading it if workflow.json has changed.
+    
+    A stopped run can still be finishing its current step on the cached builder;
+    a run started meanwhile gets a builder of its own.
+    """
+    global workflow_builder, _cached_builder, _cached_builder_mtime
+    
+    # Imported on first run: pulls in langgraph and every agent, which the dashboard pages don't need
+    from langgraph_builder import LangGraphWorkflowBuilder
+    
+    if not _builder_lock.acquire(blocking=False):
+        workflow_builder = LangGraphWorkflowBuilder(WORKFLOW_CONFIG_PATH, on_step=on_step, stop_event=stop_event,
+                                                    agent_cache=_agent_cache)
+        return workflow_builder.execute()
     
     try:
-        workflow_status['running'] = True
-        workflow_status['start_time'] = datetime.now().isoformat()
-        workflow_status['progress'] = 0
-        workflow_status['errors'] = []
+        mtime = os.stat(WORKFLOW_CONFIG_PATH).st_mtime_ns
+        if _cached_builder is None:
+            _cached_builder = LangGraphWorkflowBuilder(WORKFLOW_CONFIG_PATH, agent_cache=_agent_cache)
+        elif mtime != _cached_builder_mtime:
+            _cached_builder.reload_config()
+        _cached_builder_mtime = mtime
         
-        # Initialize workflow builder
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'workflow.json')
-        workflow_builder = LangGraphWorkflowBuilder(config_path)
+        _cached_builder.on_step = on_step
+        _cached_builder.stop_event = stop_event
+        workflow_builder = _cached_builder
+        return workflow_builder.execute()
+    finally:
+        _builder_lock.release()
+
+def run_workflow_background(stop_event):
+    """Run the workflow in a background thread until it finishes or stop_event is set."""
+    def on_step(summary):
+        # A stopped run keeps the status /api/stop left it in
+        update_run_status(stop_event, active_only=True, **step_progress(summary))
+    
+    try:
+        update_run_status(stop_event, active_only=True, running=True, start_time=datetime.now().isoformat(),
+                          progress=0, errors=[])
         
         # Execute workflow
-        results = workflow_builder.execute()
+        results = execute_workflow(on_step, stop_event)
         
-        workflow_status['results'] = results
-        workflow_status['progress'] = 100
-        workflow_status['current_step'] = 'completed'
-        workflow_status['end_time'] = datetime.now().isoformat()
+        with _status_lock:
+            if _owns_status_locked(stop_event):
+                if stop_event.is_set():
+                    # Keep the stopped status, but record what the run produced
+                    workflow_status['results'] = results
+                else:
+                    workflow_status.update(
+                        results=results,
+                        progress=100,
+                        current_step='completed',
+                        end_time=datetime.now().isoformat()
+                    )
+                _publish_locked()
         
     except Exception as e:
-        workflow_status['errors'].append(f"Workflow error: {str(e)}")
-        workflow_status['current_step'] = 'failed'
+        with _status_lock:
+            if _owns_status_locked(stop_event):
+                workflow_status['errors'] = workflow_status['errors'] + [f"Workflow error: {str(e)}"]
+                workflow_status['current_step'] = 'failed'
+                _publish_locked()
     finally:
-        workflow_status['running'] = False
+        with _status_lock:
+            _invalidate_results_locked()
+        # After a stop, running was already cleared and a new run may have started
+        update_run_status(stop_event, active_only=True, running=False)
 
 @app.route('/')
 def dashboard():
@@ -105,25 +326,37 @@ def dashboard():
 @app.route('/api/status')
 def get_status():
     """Get current workflow status."""
-    global workflow_builder
-    
-    # Update progress if workflow is running
-    if workflow_status['running'] and workflow_builder:
-        try:
-            summary = workflow_builder.get_execution_summary()
-            total_steps = summary.get('total_steps', 7)
-            executed_steps = summary.get('executed_steps', 0)
-            workflow_status['progress'] = int((executed_steps / total_steps) * 100) if total_steps > 0 else 0
-            workflow_status['current_step'] = summary.get('current_step', 'unknown')
-        except:
-            pass
+    # Progress is kept current by the worker (step_progress)
+    return fast_json(snapshot_status())
+
+@app.route('/api/events')
+def status_events():
+    """Stream workflow status changes as Server-Sent Events."""
+    def stream():
+        seen_version = None
+        while True:
+            with _status_changed:
+                _status_changed.wait_for(lambda: _status_version != seen_version, timeout=EVENTS_KEEPALIVE)
+                changed = _status_version != seen_version
+                seen_version = _status_version
+                snapshot = _snapshot_locked() if changed else None
+            
+            if changed:
+                yield b"event: status\ndata: " + dumps_json(snapshot) + b"\n\n"
+            else:
+                yield b": keep-alive\n\n"
     
-    return jsonify(workflow_status)
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/config')
 def get_config():
     """Get workflow configuration."""
-    return jsonify(load_workflow_config())
+    try:
+        body = _encoded_json_file(WORKFLOW_CONFIG_PATH, os.stat(WORKFLOW_CONFIG_PATH).st_mtime_ns)
+    except Exception:
+        return jsonify(load_workflow_config())
+    return app.response_class(body, mimetype='application/json')
 
 @app.route('/api/environment')
 def get_environment():
@@ -133,31 +366,58 @@ def get_environment():
 @app.route('/api/logs/<agent_name>')
 def get_logs(agent_name):
     """Get logs for a specific agent."""
-    logs = get_recent_logs(agent_name)
-    return jsonify({'logs': logs})
+    try:
+        st = os.stat(get_log_path(agent_name))
+    except OSError:
+        st = None
+    
+    if st is not None:
+        etag = f'{st.st_mtime_ns:x}-{st.st_size:x}'
+        
+        # Unchanged since the client's last fetch: skip reading the file
+        if request.if_none_match:
+            unchanged = request.if_none_match.contains(etag)
+        else:
+            unchanged = bool(request.if_modified_since) and int(st.st_mtime) <= request.if_modified_since.timestamp()
+        if unchanged:
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            response.last_modified = st.st_mtime
+            return response
+    
+    response = fast_json({'logs': get_recent_logs(agent_name)})
+    if st is not None:
+        response.set_etag(etag)
+        response.last_modified = st.st_mtime
+    return response
 
 @app.route('/api/start', methods=['POST'])
 def start_workflow():
     """Start the workflow execution."""
-    global workflow_thread
+    global workflow_thread, _stop_event
     
-    if workflow_status['running']:
-        return jsonify({'error': 'Workflow is already running'}), 400
-    
-    # Reset status
-    workflow_status.update({
-        'running': False,
-        'current_step': 'initializing',
-        'progress': 0,
-        'results': {},
-        'errors': [],
-        'logs': [],
-        'start_time': None,
-        'end_time': None
-    })
+    # Check and claim the run atomically so concurrent starts can't both launch
+    with _status_lock:
+        if workflow_status['running']:
+            return jsonify({'error': 'Workflow is already running'}), 400
+        
+        # Reset status
+        _invalidate_results_locked()
+        workflow_status.update({
+            'running': True,
+            'current_step': 'initializing',
+            'progress': 0,
+            'results': {},
+            'errors': [],
+            'logs': [],
+            'start_time': None,
+            'end_time': None
+        })
+        _publish_locked()
+        _stop_event = threading.Event()
     
     # Start workflow in background thread
-    workflow_thread = threading.Thread(target=run_workflow_background)
+    workflow_thread = threading.Thread(target=run_workflow_background, args=(_stop_event,))
     workflow_thread.daemon = True
     workflow_thread.start()
     
@@ -166,26 +426,70 @@ def start_workflow():
 @app.route('/api/stop', methods=['POST'])
 def stop_workflow():
     """Stop the workflow execution."""
-    global workflow_status
-    
-    if not workflow_status['running']:
-        return jsonify({'error': 'No workflow is currently running'}), 400
-    
-    workflow_status['running'] = False
-    workflow_status['current_step'] = 'stopped'
-    workflow_status['end_time'] = datetime.now().isoformat()
+    with _status_lock:
+        if not workflow_status['running']:
+            return jsonify({'error': 'No workflow is currently running'}), 400
+        
+        # The worker stops before its next step
+        _stop_event.set()
+        workflow_status.update({
+            'running': False,
+            'current_step': 'stopped',
+            'end_time': datetime.now().isoformat()
+        })
+        _publish_locked()
     
     return jsonify({'message': 'Workflow stopped'})
 
+def scan_result_logs():
+    """
+    Map each existing result log's name to its DirEntry, from a single directory scan.
+    A gzip-compressed copy (e.g. scoring.log.gz) stands in when the plain log is absent.
+    """
+    entries = {}
+    try:
+        with os.scandir(LOG_DIR) as it:
+            for entry in it:
+                name = entry.name[:-3] if entry.name.endswith('.gz') else entry.name
+                if name in RESULT_LOGS and entry.is_file() and (name not in entries or entry.name == name):
+                    entries[name] = entry
+    except OSError:
+        return {}
+    return entries
+
+def results_cache_key(generation, end_time, log_entries):
+    """Key that changes whenever /api/results could change: cache generation, run end time and result log mtimes."""
+    mtimes = []
+    for name in RESULT_LOGS:
+        try:
+            mtimes.append(log_entries[name].stat().st_mtime_ns)
+        except (KeyError, OSError):
+            mtimes.append(0)
+    return (generation, end_time, *mtimes)
+
 @app.route('/api/results')
 def get_results():
     """Get workflow execution results."""
-    # Try to get results from workflow status first
-    results = workflow_status.get('results', {})
-    
+    with _status_lock:
+        status = _snapshot_locked()
+        generation = _results_generation
+    log_entries = scan_result_logs()
+    key = results_cache_key(generation, status['end_time'], log_entries)
+    body = _results_cache.get(key)
+    if body is None:
+        body = dumps_json(build_results(status.get('results', {}), log_entries))
+        with _status_lock:
+            # Skip the store if the cache was invalidated while this body was being built
+            if generation == _results_generation:
+                _results_cache.clear()
+                _results_cache[key] = body
+    return app.response_class(body, mimetype='application/json')
+
+def build_results(results, log_entries=None):
+    """Format workflow results (from workflow status, else from the logs) for dashboard display."""
     # If no results in memory, try to parse from recent logs
     if not results or not any(results.values()):
-        results = parse_results_from_logs()
+        results = parse_results_from_logs(log_entries)
     
     # Parse and format results for dashboard display
     formatted_results = {
@@ -238,92 +542,173 @@ def get_results():
     except Exception as e:
         formatted_results['error'] = f"Error parsing results: {str(e)}"
     
-    return jsonify(formatted_results)
+    return formatted_results
 
-def parse_results_from_logs():
+def last_log_matches(path, counter, count=1):
+    """
+    Return the captures of the last `count` matches of a log counter, oldest first.
+    
+    The first call memory-maps the file and searches backwards from EOF; later calls
+    only scan what was appended since, resuming from a per-log cursor. Only complete
+    lines are consumed, so a line that is still being written is picked up next time.
+    A log that was truncated, rotated, replaced or rewritten is scanned afresh.
+    """
+    prefix, pattern = counter
+    key = (path, prefix)
+    
+    if path.endswith('.gz'):
+        # Compressed logs can't be mapped and aren't appended to: stream them whole
+        matches = deque(maxlen=count)
+        with gzip.open(path, 'rb') as f:
+            for line in f:
+                # Cheap substring check skips the regex on the (many) lines without the counter
+                if prefix in line:
+                    matches.extend(match.group(1).decode() for match in pattern.finditer(line))
+        return list(matches)
+    
+    with _log_cursors_lock, open(path, 'rb', buffering=LOG_READ_BUFFER) as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        identity = (st.st_dev, st.st_ino)
+        head = f.read(LOG_HEAD_BYTES)
+        cursor = _log_cursors.get(key)
+        
+        if (cursor is None or size < cursor[0] or cursor[1].maxlen != count
+                or cursor[2] != identity or not head.startswith(cursor[3])):
+            # First scan, or the log was truncated, replaced or rewritten: search back from EOF
+            offset = 0
+            matches = deque(maxlen=count)
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    offset = end = mm.rfind(b'\n') + 1
+                    while len(matches) < count:
+                        pos = mm.rfind(prefix, 0, end)
+                        if pos < 0:
+                            break
+                        match = pattern.match(mm, pos, offset)
+                        if match:
+                            matches.appendleft(match.group(1).decode())
+                        end = pos
+        else:
+            offset, matches = cursor[:2]
+            if size > offset:
+                # Stream the appended lines rather than reading them in one piece
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    if prefix in line:
+                        matches.extend(match.group(1).decode() for match in pattern.finditer(line))
+                    offset += len(line)
+        
+        _log_cursors[key] = (offset, matches, identity, head[:offset])
+        return list(matches)
+
+@lru_cache(maxsize=8)
+def _company_stubs(count):
+    """Placeholder leads for a count scraped from the logs, built once per count."""
+    return tuple({'company': f'Company {i+1}'} for i in range(count))
+
+@lru_cache(maxsize=8)
+def _message_stubs(count):
+    """Placeholder messages for a count scraped from the logs, built once per count."""
+    return tuple({'lead_id': f'lead_{i}'} for i in range(count))
+
+# Placeholder sends only need their status, so every entry shares one dict
+_SENT_STUB = {'status': 'sent'}
+
+# Default mock data, used when the logs can't be parsed at all
+_FALLBACK_RESULTS = {
+    'prospect_search': {
+        'leads': _company_stubs(4),
+        'total_found': 4
+    },
+    'scoring': {
+        'ranked_leads': ({'score': 8.5}, {'score': 8.4}, {'score': 7.9}, {'score': 6.9})
+    },
+    'outreach_content': {
+        'messages': _message_stubs(4)
+    },
+    'send': {
+        'sent_status': (_SENT_STUB,) * 4
+    }
+}
+
+def parse_results_from_logs(log_entries=None):
     """Parse workflow results from log files when memory is empty."""
+    if log_entries is None:
+        log_entries = scan_result_logs()
+    
+    # Logs with the same mtime and size as last time reuse the previous parse
+    log_files = []
+    for name, entry in sorted(log_entries.items()):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        log_files.append((name, entry.path, st.st_mtime_ns, st.st_size))
+    return _parse_results_cached(tuple(log_files))
+
+@lru_cache(maxsize=4)
+def _parse_results_cached(log_files):
+    """Parse results from (name, path, mtime_ns, size) log descriptors; see parse_results_from_logs."""
     results = {}
-    log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+    log_paths = {name: path for name, path, _, _ in log_files}
     
     try:
-        import re
-        
         # SIMPLE APPROACH: Just count the most recent successful results from logs
         
         # Parse prospect search - count leads
-        prospect_file = os.path.join(log_dir, 'prospect_search.log')
-        if os.path.exists(prospect_file):
-            with open(prospect_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Find the most recent "total_found": X pattern
-                total_found_matches = re.findall(r'"total_found":\s*(\d+)', content)
-                if total_found_matches:
-                    count = int(total_found_matches[-1])  # Get the last/most recent
-                    if count > 0:
-                        results['prospect_search'] = {
-                            'leads': [{'company': f'Company {i+1}'} for i in range(count)],
-                            'total_found': count
-                        }
+        if 'prospect_search.log' in log_paths:
+            prospect_file = log_paths['prospect_search.log']
+            # Find the most recent "total_found": X pattern
+            total_found_matches = last_log_matches(prospect_file, _TOTAL_FOUND)
+            if total_found_matches:
+                count = int(total_found_matches[-1])
+                if count > 0:
+                    results['prospect_search'] = {
+                        'leads': _company_stubs(count),
+                        'total_found': count
+                    }
         
         # Parse scoring results - count scores
-        scoring_file = os.path.join(log_dir, 'scoring.log')
-        if os.path.exists(scoring_file):
-            with open(scoring_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Look for actual scores in recent logs
-                score_matches = re.findall(r'"score":\s*(\d+\.\d+)', content)
-                if score_matches:
-                    # Get the last 4 scores (one per lead)
-                    recent_scores = [float(s) for s in score_matches[-4:]]
-                    results['scoring'] = {
-                        'ranked_leads': [{'score': s} for s in recent_scores]
-                    }
+        if 'scoring.log' in log_paths:
+            scoring_file = log_paths['scoring.log']
+            # Get the last 4 scores (one per lead)
+            score_matches = last_log_matches(scoring_file, _SCORE, count=4)
+            if score_matches:
+                recent_scores = [float(s) for s in score_matches]
+                results['scoring'] = {
+                    'ranked_leads': [{'score': s} for s in recent_scores]
+                }
         
         # Parse content generation - count messages
-        content_file = os.path.join(log_dir, 'outreach_content.log')
-        if os.path.exists(content_file):
-            with open(content_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Count successful message generations
-                success_matches = re.findall(r'"successful_generations":\s*(\d+)', content)
-                if success_matches:
-                    msg_count = int(success_matches[-1])  # Most recent
-                    if msg_count > 0:
-                        results['outreach_content'] = {
-                            'messages': [{'lead_id': f'lead_{i}'} for i in range(msg_count)]
-                        }
+        if 'outreach_content.log' in log_paths:
+            content_file = log_paths['outreach_content.log']
+            # Count successful message generations
+            success_matches = last_log_matches(content_file, _SUCCESSFUL_GENERATIONS)
+            if success_matches:
+                msg_count = int(success_matches[-1])
+                if msg_count > 0:
+                    results['outreach_content'] = {
+                        'messages': _message_stubs(msg_count)
+                    }
         
         # Parse send results - count successful sends
-        send_file = os.path.join(log_dir, 'send.log')
-        if os.path.exists(send_file):
-            with open(send_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Count successful sends
-                success_matches = re.findall(r'"successful_sends":\s*(\d+)', content)
-                if success_matches:
-                    send_count = int(success_matches[-1])  # Most recent
-                    if send_count > 0:
-                        results['send'] = {
-                            'sent_status': [{'status': 'sent'} for i in range(send_count)]
-                        }
+        if 'send.log' in log_paths:
+            send_file = log_paths['send.log']
+            # Count successful sends
+            success_matches = last_log_matches(send_file, _SUCCESSFUL_SENDS)
+            if success_matches:
+                send_count = int(success_matches[-1])
+                if send_count > 0:
+                    results['send'] = {
+                        'sent_status': (_SENT_STUB,) * send_count
+                    }
                     
     except Exception as e:
-        # If all parsing fails, create default mock data based on what we know works
-        results = {
-            'prospect_search': {
-                'leads': [{'company': f'Company {i+1}'} for i in range(4)],
-                'total_found': 4
-            },
-            'scoring': {
-                'ranked_leads': [{'score': 8.5}, {'score': 8.4}, {'score': 7.9}, {'score': 6.9}]
-            },
-            'outreach_content': {
-                'messages': [{'lead_id': f'lead_{i}'} for i in range(4)]
-            },
-            'send': {
-                'sent_status': [{'status': 'sent'} for i in range(4)]
-            }
-        }
+        # If all parsing fails, fall back to default mock data based on what we know works
+        results = _FALLBACK_RESULTS
     
     return results
 
@@ -333,8 +718,7 @@ def get_campaign_feedback():
     feedback_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'campaign_feedback.json')
     try:
         if os.path.exists(feedback_file):
-            with open(feedback_file, 'r') as f:
-                return jsonify(json.loads(f.read()))
+            return jsonify(_cached_json(feedback_file))
         return jsonify({'error': 'No campaign feedback available'})
     except Exception as e:
         return jsonify({'error': f'Failed to load feedback: {str(e)}'})
@@ -0,0 +1,11 @@
+"""
+WSGI entry point for serving the dashboard with a production server.
+
+Workflow state lives in this process, so run a single worker and scale with threads:
+
+    gunicorn --chdir frontend -k gthread -w 1 --threads 16 wsgi:application
+"""
+
+from app import app
+
+application = app
@@ -2,16 +2,20 @@
 LangGraph Builder - Dynamically constructs and executes workflow from JSON configuration
 """
 
+import atexit
+import copy
 import json
 import os
 import logging
-from typing import Dict, Any, List
+import logging.handlers
+import queue
+import threading
+from typing import Dict, Any, List, Callable, Optional, Sequence
 from datetime import datetime
 
 # LangGraph imports
 try:
     from langgraph.graph import StateGraph, END
-    from langgraph.checkpoint.memory import MemorySaver
     LANGGRAPH_AVAILABLE = True
 except ImportError:
     LANGGRAPH_AVAILABLE = False
@@ -21,94 +25,113 @@ except ImportError:
 from agents import AgentRegistry
 
 
+class WorkflowStopped(Exception):
+    """Raised inside a LangGraph run to abort it once a stop has been requested."""
+
+
+def _navigate(value: Any, keys: Sequence[str]) -> Any:
+    """Follow keys through nested dictionaries, returning None if any is missing."""
+    for key in keys:
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        else:
+            return None
+    return value
+
+
 class WorkflowState:
     """State management for the LangGraph workflow."""
     
     def __init__(self):
         self.data = {}
         self.execution_history = []
+        self.successful_steps = 0
+        self.failed_steps = 0
         self.current_step = None
         self.error = None
         
     def update(self, step_id: str, output: Dict[str, Any]):
         """Update state with step output."""
+        success = 'error' not in output
         self.data[step_id] = output
         self.execution_history.append({
             'step_id': step_id,
             'timestamp': datetime.now().isoformat(),
             'output_keys': list(output.keys()),
-            'success': 'error' not in output
+            'success': success
         })
+        if success:
+            self.successful_steps += 1
+        else:
+            self.failed_steps += 1
         self.current_step = step_id
     
+    @staticmethod
+    def compile_input(input_spec: Any) -> Callable[['WorkflowState', Dict[str, Any]], Any]:
+        """
+        Parse an input spec once into a resolver function.
+        
+        Args:
+            input_spec: Literal value or reference such as "{{prospect_search.output.leads}}"
+            
+        Returns:
+            Function of (state, config) returning the resolved input value
+        """
+        if not (isinstance(input_spec, str) and input_spec.startswith('{{') and input_spec.endswith('}}')):
+            return lambda state, config: input_spec
+        
+        # Extract reference path (e.g., "{{prospect_search.output.leads}}")
+        ref_path = input_spec[2:-2].strip()
+        
+        if ref_path.startswith('config.'):
+            # Reference to config
+            config_keys = tuple(ref_path[7:].split('.'))  # Remove 'config.'
+            return lambda state, config: _navigate(config, config_keys)
+        
+        # Reference to previous step output
+        parts = ref_path.split('.')
+        step_id = parts[0]
+        
+        # Skip the "output" part since our agents return data directly;
+        # other paths are legacy references navigated as-is
+        path = tuple(parts[2:]) if len(parts) > 1 and parts[1] == 'output' else tuple(parts[1:])
+        
+        def resolve_step_output(state: 'WorkflowState', config: Dict[str, Any]) -> Any:
+            if step_id not in state.data:
+                # Step not found
+                return None
+            return _navigate(state.data[step_id], path)
+        
+        return resolve_step_output
+    
     def get_input_data(self, input_spec: str, config: Dict[str, Any]) -> Any:
         """Resolve input data from state or config."""
-        if isinstance(input_spec, str) and input_spec.startswith('{{') and input_spec.endswith('}}'):
-            # Extract reference path (e.g., "{{prospect_search.output.leads}}")
-            ref_path = input_spec[2:-2].strip()
-            
-            if ref_path.startswith('config.'):
-                # Reference to config
-                config_key = ref_path[7:]  # Remove 'config.'
-                return self._get_nested_value(config, config_key)
-            else:
-                # Reference to previous step output
-                parts = ref_path.split('.')
-                if len(parts) >= 1:
-                    step_id = parts[0]
-                    if step_id in self.data:
-                        value = self.data[step_id]
-                        
-                        # Handle the ".output." pattern specially
-                        if len(parts) > 1 and parts[1] == 'output':
-                            # Skip the "output" part since our agents return data directly
-                            for part in parts[2:]:
-                                if isinstance(value, dict) and part in value:
-                                    value = value[part]
-                                else:
-                                    # If specific field not found, return None
-                                    return None
-                        else:
-                            # Legacy path navigation for older references
-                            for part in parts[1:]:
-                                if isinstance(value, dict) and part in value:
-                                    value = value[part]
-                                else:
-                                    # If path doesn't exist, return None
-                                    return None
-                        
-                        return value
-                    else:
-                        # Step not found
-                        return None
-        
-        return input_spec
+        return self.compile_input(input_spec)(self, config)
     
     def _get_nested_value(self, obj: Dict[str, Any], path: str) -> Any:
         """Get nested value from dictionary using dot notation."""
-        keys = path.split('.')
-        current = obj
-        
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return None
-        
-        return current
+        return _navigate(obj, path.split('.'))
 
 
 class LangGraphWorkflowBuilder:
     """Builds and executes LangGraph workflows from JSON configuration."""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, on_step: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 stop_event: Optional[threading.Event] = None, agent_cache: Optional[Dict[tuple, tuple]] = None):
         """
         Initialize the workflow builder.
         
         Args:
             config_path: Path to the workflow.json configuration file
+            on_step: Optional callback invoked with the execution summary after each step
+            stop_event: Optional event that, once set, stops execution before the next step
+            agent_cache: Optional dict to share agent instances across builders. Agents are
+                reused between runs, so they must not carry per-run state between execute() calls
         """
         self.config_path = config_path
+        self.on_step = on_step
+        self.stop_event = stop_event or threading.Event()
+        self._agent_cache = agent_cache if agent_cache is not None else {}
         self.config = None
         self.workflow_state = WorkflowState()
         self.logger = self._setup_logging()
@@ -118,11 +141,20 @@ class LangGraphWorkflowBuilder:
         
         # Import and register all agents
         self._import_agents()
+        
+        # Node functions, step routing and the compiled graph only depend on the config
+        self._build_execution_plan()
     
     def _setup_logging(self) -> logging.Logger:
         """Set up logging for the workflow builder."""
         logger = logging.getLogger("langgraph_builder")
+        
+        # Builders share one named logger; only attach the handler once
+        if logger.handlers:
+            return logger
+        
         logger.setLevel(logging.INFO)
+        logger.propagate = False
         
         # Create console handler
         console_handler = logging.StreamHandler()
@@ -134,8 +166,14 @@ class LangGraphWorkflowBuilder:
         )
         console_handler.setFormatter(formatter)
         
+        # Workflow threads only enqueue records; a listener thread formats and writes them
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        
         # Add handler to logger
-        logger.addHandler(console_handler)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
         
         return logger
     
@@ -149,12 +187,53 @@ class LangGraphWorkflowBuilder:
             self.logger.error(f"Failed to load configuration from {self.config_path}: {e}")
             raise
     
+    def reload_config(self):
+        """Re-read the configuration file and rebuild the cached execution plan and graph."""
+        self._load_config()
+        self._build_execution_plan()
+    
+    def _build_execution_plan(self):
+        """Precompute step lookups, node functions and the compiled LangGraph from the config."""
+        self.step_configs = {step['id']: step for step in self.config['steps']}
+        self.node_functions = {
+            step_id: self._create_node_function(step_config)
+            for step_id, step_config in self.step_configs.items()
+        }
+        
+        # Next step for each step; the first matching edge wins
+        self.next_steps = {}
+        for edge in self.config.get('flow', {}).get('edges', []):
+            self.next_steps.setdefault(edge['from'], edge['to'])
+        
+        self._compiled_graph = self._build_langgraph() if LANGGRAPH_AVAILABLE else None
+    
     def _import_agents(self):
         """Import all agent modules to register them."""
         # Agents are already imported and registered via the @AgentRegistry.register decorator
         registered_agents = AgentRegistry.list_agents()
         self.logger.info(f"Registered agents: {registered_agents}")
     
+    def _get_agent(self, agent_name: str, step_id: str, step_config: Dict[str, Any]):
+        """
+        Get the agent for a step, reusing the cached instance while its step config is unchanged.
+        
+        Args:
+            agent_name: Registered agent class name
+            step_id: Workflow step identifier
+            step_config: Step configuration from workflow.json
+            
+        Returns:
+            Agent instance
+        """
+        key = (agent_name, step_id)
+        cached = self._agent_cache.get(key)
+        if cached is None or cached[0] != step_config:
+            # Agents may resolve their tool config in place, so they get their own copy
+            agent = AgentRegistry.create_agent(agent_name, step_id, copy.deepcopy(step_config))
+            cached = (copy.deepcopy(step_config), agent)
+            self._agent_cache[key] = cached
+        return cached[1]
+    
     def _create_node_function(self, step_config: Dict[str, Any]):
         """
         Create a node function for LangGraph from step configuration.
@@ -165,21 +244,28 @@ class LangGraphWorkflowBuilder:
         Returns:
             Function that can be used as a LangGraph node
         """
+        step_id = step_config['id']
+        agent_name = step_config['agent']
+        
+        # Parse input references once; each execution only runs the resolvers
+        input_plan = [
+            (key, WorkflowState.compile_input(value))
+            for key, value in step_config.get('inputs', {}).items()
+        ]
+        
         def node_function(state: WorkflowState) -> WorkflowState:
-            step_id = step_config['id']
-            agent_name = step_config['agent']
+            if self.stop_event.is_set():
+                raise WorkflowStopped(step_id)
             
-            self.logger.info(f"Executing step: {step_id} with agent: {agent_name}")
+            self.logger.info("Executing step: %s with agent: %s", step_id, agent_name)
             
             try:
-                # Create agent instance
-                agent = AgentRegistry.create_agent(agent_name, step_id, step_config)
+                # Get (or create) the agent instance
+                agent = self._get_agent(agent_name, step_id, step_config)
                 
                 # Resolve inputs
-                inputs = {}
-                for key, value in step_config.get('inputs', {}).items():
-                    resolved_value = state.get_input_data(value, self.config.get('config', {}))
-                    inputs[key] = resolved_value
+                config = self.config.get('config', {})
+                inputs = {key: resolve(state, config) for key, resolve in input_plan}
                 
                 # Execute agent
                 output = agent.run(inputs)
@@ -187,10 +273,10 @@ class LangGraphWorkflowBuilder:
                 # Update state
                 state.update(step_id, output)
                 
-                self.logger.info(f"Step {step_id} completed successfully")
+                self.logger.info("Step %s completed successfully", step_id)
                 
             except Exception as e:
-                self.logger.error(f"Step {step_id} failed: {e}")
+                self.logger.error("Step %s failed: %s", step_id, e)
                 error_output = {
                     'error': True,
                     'message': str(e),
@@ -198,6 +284,9 @@ class LangGraphWorkflowBuilder:
                 }
                 state.update(step_id, error_output)
             
+            if self.on_step:
+                self.on_step(self.get_execution_summary())
+            
             return state
         
         return node_function
@@ -217,9 +306,7 @@ class LangGraphWorkflowBuilder:
         workflow = StateGraph(WorkflowState)
         
         # Add nodes for each step
-        for step in self.config['steps']:
-            step_id = step['id']
-            node_function = self._create_node_function(step)
+        for step_id, node_function in self.node_functions.items():
             workflow.add_node(step_id, node_function)
         
         # Add edges based on flow configuration
@@ -240,9 +327,9 @@ class LangGraphWorkflowBuilder:
         if end_node:
             workflow.add_edge(end_node, END)
         
-        # Compile workflow
-        checkpointer = MemorySaver()
-        compiled_workflow = workflow.compile(checkpointer=checkpointer)
+        # Compile workflow. No checkpointer: nothing reads past runs' checkpoints, and
+        # on a builder reused across runs they would pile up in memory
+        compiled_workflow = workflow.compile()
         
         return compiled_workflow
     
@@ -262,23 +349,21 @@ class LangGraphWorkflowBuilder:
         if not start_step:
             raise ValueError("No start step defined in workflow flow")
         
-        # Create a mapping of step IDs to step configs
-        step_configs = {step['id']: step for step in self.config['steps']}
-        
         # Execute steps sequentially based on edges
         current_step = start_step
         executed_steps = set()
         
         while current_step and current_step not in executed_steps:
-            if current_step not in step_configs:
-                self.logger.error(f"Step {current_step} not found in configuration")
+            if self.stop_event.is_set():
+                self.logger.info("Workflow stopped before step %s", current_step)
                 break
             
-            step_config = step_configs[current_step]
+            if current_step not in self.node_functions:
+                self.logger.error(f"Step {current_step} not found in configuration")
+                break
             
             # Execute the step
-            node_function = self._create_node_function(step_config)
-            self.workflow_state = node_function(self.workflow_state)
+            self.workflow_state = self.node_functions[current_step](self.workflow_state)
             
             # Check for errors
             if self.workflow_state.error:
@@ -288,13 +373,7 @@ class LangGraphWorkflowBuilder:
             executed_steps.add(current_step)
             
             # Find next step
-            next_step = None
-            for edge in flow.get('edges', []):
-                if edge['from'] == current_step:
-                    next_step = edge['to']
-                    break
-            
-            current_step = next_step
+            current_step = self.next_steps.get(current_step)
         
         self.logger.info("Mock workflow execution completed")
         return self.workflow_state.data
@@ -311,21 +390,25 @@ class LangGraphWorkflowBuilder:
         """
         self.logger.info(f"Starting workflow execution: {self.config['workflow_name']}")
         
+        # Each run starts from a fresh state so a builder can be reused across runs
+        self.workflow_state = WorkflowState()
         if initial_state:
             self.workflow_state.data.update(initial_state)
         
         if LANGGRAPH_AVAILABLE:
-            # Execute with LangGraph
-            workflow = self._build_langgraph()
+            # Execute with the graph compiled at build time
+            workflow = self._compiled_graph
             
             if workflow:
                 try:
                     # Execute workflow
-                    thread = {"configurable": {"thread_id": "1"}}
-                    result = workflow.invoke(self.workflow_state, thread)
+                    result = workflow.invoke(self.workflow_state)
                     
                     return result.data if hasattr(result, 'data') else result
                     
+                except WorkflowStopped as e:
+                    self.logger.info(f"Workflow stopped before step {e}")
+                    return self.workflow_state.data
                 except Exception as e:
                     self.logger.error(f"LangGraph execution failed: {e}")
                     # Fall back to mock execution
@@ -347,8 +430,8 @@ class LangGraphWorkflowBuilder:
             'workflow_name': self.config.get('workflow_name', 'Unknown'),
             'total_steps': len(self.config.get('steps', [])),
             'executed_steps': len(self.workflow_state.execution_history),
-            'successful_steps': len([h for h in self.workflow_state.execution_history if h['success']]),
-            'failed_steps': len([h for h in self.workflow_state.execution_history if not h['success']]),
+            'successful_steps': self.workflow_state.successful_steps,
+            'failed_steps': self.workflow_state.failed_steps,
             'execution_history': self.workflow_state.execution_history,
             'current_step': self.workflow_state.current_step,
             'has_errors': self.workflow_state.error is not None
@@ -6,6 +6,8 @@ Launches the Flask web server with proper configuration
 
 import sys
 import os
+import argparse
+import socket
 import webbrowser
 import time
 import threading
@@ -13,45 +15,83 @@ import threading
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-def open_browser():
-    """Open the browser after a short delay"""
-    time.sleep(2)  # Wait 2 seconds for the server to start
-    webbrowser.open('http://localhost:5000')
+# Import the Flask app up front so the import cost is paid before the banner,
+# not while the browser is already waiting on the server
+try:
+    from frontend.app import app
+    APP_IMPORT_ERROR = None
+except ImportError as e:
+    app = None
+    APP_IMPORT_ERROR = e
+
+def wait_for_port(host, port, attempts=100, interval=0.05):
+    """Poll until host:port accepts TCP connections; returns False if it never does"""
+    for _ in range(attempts):
+        try:
+            with socket.create_connection((host, port), timeout=interval):
+                return True
+        except OSError:
+            time.sleep(interval)
+    return False
+
+def open_browser(port):
+    """Open the browser as soon as the server is listening"""
+    wait_for_port('127.0.0.1', port)
+    webbrowser.open(f'http://localhost:{port}')
+
+def has_display():
+    """Whether a browser window can be opened (false in headless CI/Docker)"""
+    if sys.platform in ('win32', 'darwin'):
+        return True
+    return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
 
 def main():
     """Main function to start the dashboard"""
+    parser = argparse.ArgumentParser(description='Start the Prospect to Lead Workflow Dashboard')
+    parser.add_argument('--no-browser', action='store_true', help="Don't open a browser window")
+    parser.add_argument('--port', type=int, default=5000, help='Port to serve on (default: 5000)')
+    args = parser.parse_args()
+    
     print("🚀 Prospect to Lead Workflow Dashboard")
     print("=" * 50)
     print("📊 Starting web server...")
-    print("🌐 Dashboard will open at: http://localhost:5000")
+    print(f"🌐 Dashboard will open at: http://localhost:{args.port}")
     print("⏰ Please wait while the server initializes...")
     print("=" * 50)
     
-    # Open browser in a separate thread
-    browser_thread = threading.Thread(target=open_browser)
-    browser_thread.daemon = True
-    browser_thread.start()
+    if APP_IMPORT_ERROR is not None:
+        print(f"❌ Could not import the dashboard app: {APP_IMPORT_ERROR}")
+        print("\nMake sure all dependencies are installed: pip install -r requirements.txt")
+        return 1
+    
+    # Open browser in a separate thread, unless disabled or headless
+    if not args.no_browser and has_display():
+        browser_thread = threading.Thread(target=open_browser, args=(args.port,))
+        browser_thread.daemon = True
+        browser_thread.start()
     
-    # Import and run the Flask app
+    # Run the Flask app
     try:
-        from frontend.app import app
         print("\n✅ Server starting successfully!")
         print("💡 Press Ctrl+C to stop the server")
-        print("🔄 The dashboard will refresh automatically every 2 seconds")
+        print("🔄 The dashboard updates live while the workflow runs")
         print("-" * 50)
         
-        # Run the Flask app
+        # Run the Flask app. Threads (not processes) so concurrent polls and open
+        # /api/events streams don't block each other, and all requests share the
+        # in-memory status and log caches. See frontend/wsgi.py for gunicorn.
         app.run(
             debug=False,  # Set to False for cleaner output
             host='0.0.0.0',
-            port=5000,
-            use_reloader=False  # Disable reloader to prevent double startup
+            port=args.port,
+            use_reloader=False,  # Disable reloader to prevent double startup
+            threaded=True
         )
     except Exception as e:
         print(f"❌ Error starting the dashboard: {e}")
         print("\nTroubleshooting tips:")
         print("1. Make sure all dependencies are installed: pip install -r requirements.txt")
-        print("2. Check if port 5000 is already in use")
+        print(f"2. Check if port {args.port} is already in use (or pass --port)")
         print("3. Ensure you're in the correct directory")
         return 1
     
@@ -4,12 +4,23 @@
 import os
 import sys
 import json
+import gzip
+import shutil
+import tempfile
+
+# Fast JSON encoding (optional - falls back to json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add the frontend directory to the Python path
 frontend_dir = os.path.join(os.path.dirname(__file__), 'frontend')
 sys.path.insert(0, frontend_dir)
 
 # Import the parsing function
+import app
 from app import parse_results_from_logs
 
 def test_parsing():
@@ -18,7 +29,11 @@ def test_parsing():
     
     try:
         results = parse_results_from_logs()
-        print(f"Results: {json.dumps(results, indent=2)}")
+        if ORJSON_AVAILABLE:
+            results_text = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+        else:
+            results_text = json.dumps(results, indent=2)
+        print(f"Results: {results_text}")
         
         # Check if we got any data
         if not results:
@@ -42,10 +57,37 @@ def test_parsing():
                 sent = len(results['send'].get('sent_status', []))
                 print(f"  - Emails sent: {sent}")
                 
-    except Exception as e:
+    except (OSError, ValueError, TypeError) as e:
+        # File access, JSON decode (ValueError) and JSON encode (TypeError) errors
         print(f"Error testing parsing: {e}")
         import traceback
         traceback.print_exc()
 
+def test_gzip_parsing():
+    """Test that gzip-compressed logs parse the same as the plain logs"""
+    print("\nTesting gzip log parsing...")
+    
+    log_dir = app.LOG_DIR
+    with tempfile.TemporaryDirectory() as plain_dir, tempfile.TemporaryDirectory() as gz_dir:
+        for name in app.RESULT_LOGS:
+            source = os.path.join(log_dir, name)
+            if not os.path.exists(source):
+                continue
+            shutil.copy(source, os.path.join(plain_dir, name))
+            with open(source, 'rb') as f_in, gzip.open(os.path.join(gz_dir, name + '.gz'), 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        
+        try:
+            app.LOG_DIR = plain_dir
+            plain_results = parse_results_from_logs()
+            app.LOG_DIR = gz_dir
+            gz_results = parse_results_from_logs()
+        finally:
+            app.LOG_DIR = log_dir
+    
+    assert gz_results == plain_results, f"gzip results differ: {gz_results} != {plain_results}"
+    print("gzip parsing matches plain parsing!")
+
 if __name__ == "__main__":
-    test_parsing()
\ No newline at end of file
+    test_parsing()
+    test_gzip_parsing()
\ No newline at end of file
@@ -2,78 +2,143 @@
 """Test SendGrid API configuration"""
 
 import os
+import socket
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+# Fast JSON decoding (optional - falls back to json)
+try:
+    import orjson
+    loads_json = orjson.loads
+except ImportError:
+    loads_json = json.loads
+
 # Load environment variables
 load_dotenv()
 
+API_KEY = os.getenv('SENDGRID_API_KEY')
+SENDER_EMAIL = os.getenv('SENDER_EMAIL')
+
+# Set SENDGRID_DEBUG=1 to print full API responses
+DEBUG = os.getenv('SENDGRID_DEBUG') == '1'
+
+# SendGrid accepts up to 1,000 personalizations per /v3/mail/send request
+SEND_BATCH_SIZE = 1000
+MAX_SEND_WORKERS = 8
+
+# Retry rate limits (429) and transient 5xx with backoff, honouring Retry-After
+RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True
+)
+
+# mail/send is not idempotent: a 5xx or dropped response may arrive after SendGrid
+# accepted the batch, so only rate-limited (429) sends are retried
+SEND_URL = 'https://api.sendgrid.com/v3/mail/send'
+SEND_RETRY = Retry(
+    total=5,
+    read=0,
+    backoff_factor=0.5,
+    status_forcelist=(429,),
+    allowed_methods=frozenset(['POST']),
+    respect_retry_after_header=True
+)
+
+# One keep-alive session so the SendGrid calls reuse a single TLS connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_SEND_WORKERS, max_retries=RETRY))
+SESSION.mount(SEND_URL, HTTPAdapter(pool_connections=1, pool_maxsize=MAX_SEND_WORKERS, max_retries=SEND_RETRY))
+
+def configure_session(session, api_key):
+    """Set the SendGrid auth and content headers on the session"""
+    session.headers.update({
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json'
+    })
+
+def warm_connection(session, host='api.sendgrid.com'):
+    """Resolve the host and open the pooled TLS connection ahead of the real calls"""
+    try:
+        socket.getaddrinfo(host, 443)
+        session.head(f'https://{host}/v3/', timeout=5)
+    except (socket.gaierror, requests.RequestException):
+        # Best effort only; the real calls report connection problems
+        pass
+
 def test_sendgrid_api():
     """Test SendGrid API key and sender verification"""
-    api_key = os.getenv('SENDGRID_API_KEY')
-    sender_email = os.getenv('SENDER_EMAIL')
-    
     print(f"Testing SendGrid API...")
-    print(f"API Key: {api_key[:10]}...{api_key[-10:] if api_key else 'None'}")
-    print(f"Sender Email: {sender_email}")
+    print(f"API Key: {API_KEY[:10]}...{API_KEY[-10:] if API_KEY else 'None'}")
+    print(f"Sender Email: {SENDER_EMAIL}")
     print("-" * 50)
     
-    if not api_key:
+    if not API_KEY:
         print("❌ ERROR: SENDGRID_API_KEY not found in environment")
         return False
     
-    if not sender_email:
+    if not SENDER_EMAIL:
         print("❌ ERROR: SENDER_EMAIL not found in environment")
         return False
     
+    # Both checks are independent, so issue them concurrently
+    configure_session(SESSION, API_KEY)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        account_future = executor.submit(SESSION.get, 'https://api.sendgrid.com/v3/user/account')
+        senders_future = executor.submit(SESSION.get, 'https://api.sendgrid.com/v3/verified_senders')
+    
     # Test 1: Check API key validity
     print("1. Testing API key validity...")
     try:
-        headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.get('https://api.sendgrid.com/v3/user/account', headers=headers)
+        response = account_future.result()
         
         if response.status_code == 200:
-            account_info = response.json()
+            account_info = loads_json(response.content)
             print(f"✅ API Key valid! Account: {account_info.get('username', 'Unknown')}")
         else:
             print(f"❌ API Key invalid! Status: {response.status_code}")
             print(f"Response: {response.text}")
             return False
             
-    except Exception as e:
+    except (requests.RequestException, ValueError) as e:
         print(f"❌ Error testing API key: {e}")
         return False
     
     # Test 2: Check sender verification
     print("\n2. Checking sender verification...")
     try:
-        response = requests.get('https://api.sendgrid.com/v3/verified_senders', headers=headers)
+        response = senders_future.result()
         
         if response.status_code == 200:
-            senders = response.json()
+            senders = loads_json(response.content)
             print(f"Verified senders found: {len(senders)}")
-            print(f"Senders response: {senders}")
+            if DEBUG:
+                print(f"Senders response: {senders}")
             
             # Handle both list and dict responses
             if isinstance(senders, list):
-                verified_emails = [sender.get('from_email') for sender in senders if isinstance(sender, dict) and sender.get('verified')]
+                results = senders
             else:
                 # If it's not a list, try to extract from results key
                 results = senders.get('results', [])
-                verified_emails = [sender.get('from_email') for sender in results if isinstance(sender, dict) and sender.get('verified')]
+            verified_emails = frozenset(
+                sender['from_email'] for sender in results
+                if isinstance(sender, dict) and sender.get('verified') and sender.get('from_email')
+            )
             
-            print(f"Verified emails: {verified_emails}")
+            print(f"Verified emails: {sorted(verified_emails)}")
             
-            if sender_email in verified_emails:
-                print(f"✅ Sender email {sender_email} is verified!")
+            if SENDER_EMAIL in verified_emails:
+                print(f"✅ Sender email {SENDER_EMAIL} is verified!")
                 return True
             else:
-                print(f"❌ Sender email {sender_email} is NOT verified!")
+                print(f"❌ Sender email {SENDER_EMAIL} is NOT verified!")
                 print("You need to verify this email in your SendGrid dashboard.")
                 return False
         else:
@@ -81,63 +146,90 @@ def test_sendgrid_api():
             print(f"Response: {response.text}")
             return False
             
-    except Exception as e:
+    except (requests.RequestException, ValueError, AttributeError) as e:
         print(f"❌ Error checking senders: {e}")
         return False
 
-def test_send_email():
-    """Test sending a simple email"""
-    api_key = os.getenv('SENDGRID_API_KEY')
-    sender_email = os.getenv('SENDER_EMAIL')
-    
-    print("\n3. Testing email send...")
-    
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json'
-    }
-    
-    # Test email to yourself
+def _post_batch(session, sender, recipients, subject, body):
+    """POST one /v3/mail/send request with a personalization per recipient"""
     email_data = {
-        "personalizations": [{
-            "to": [{"email": sender_email}],
-            "subject": "SendGrid Test Email"
-        }],
-        "from": {"email": sender_email},
+        "personalizations": [
+            {"to": [{"email": recipient}], "subject": subject}
+            for recipient in recipients
+        ],
+        "from": {"email": sender},
         "content": [{
             "type": "text/plain",
-            "value": "This is a test email from your SendGrid setup. If you receive this, your configuration is working!"
+            "value": body
         }]
     }
     
     try:
-        response = requests.post('https://api.sendgrid.com/v3/mail/send', 
-                               headers=headers, 
-                               json=email_data)
+        response = session.post(SEND_URL, json=email_data)
         
         if response.status_code == 202:
-            print("✅ Test email sent successfully!")
-            print("Check your inbox (and spam folder) for the test email.")
             return True
         else:
-            print(f"❌ Failed to send test email! Status: {response.status_code}")
+            print(f"❌ Failed to send batch of {len(recipients)}! Status: {response.status_code}")
             print(f"Response: {response.text}")
             return False
             
-    except Exception as e:
-        print(f"❌ Error sending test email: {e}")
+    except requests.RequestException as e:
+        print(f"❌ Error sending batch of {len(recipients)}: {e}")
         return False
 
+def send_batch(session, sender, recipients, subject, body):
+    """Send one email per recipient, up to SEND_BATCH_SIZE recipients per request.
+    
+    Multiple batches are posted concurrently over the shared session.
+    Returns True only if every batch was accepted; False if there is nobody to send to.
+    """
+    if not recipients:
+        print("❌ No recipients to send to!")
+        return False
+    
+    batches = [recipients[i:i + SEND_BATCH_SIZE] for i in range(0, len(recipients), SEND_BATCH_SIZE)]
+    if len(batches) == 1:
+        return _post_batch(session, sender, batches[0], subject, body)
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_SEND_WORKERS, len(batches))) as executor:
+        results = list(executor.map(lambda batch: _post_batch(session, sender, batch, subject, body), batches))
+    return all(results)
+
+def test_send_email(session=SESSION):
+    """Test sending a simple email"""
+    print("\n3. Testing email send...")
+    
+    # Normally already configured by test_sendgrid_api
+    if 'Authorization' not in session.headers:
+        configure_session(session, API_KEY)
+    
+    # Test email to yourself
+    sent = send_batch(
+        session,
+        SENDER_EMAIL,
+        [SENDER_EMAIL],
+        "SendGrid Test Email",
+        "This is a test email from your SendGrid setup. If you receive this, your configuration is working!"
+    )
+    
+    if sent:
+        print("✅ Test email sent successfully!")
+        print("Check your inbox (and spam folder) for the test email.")
+    return sent
+
 if __name__ == "__main__":
     print("SendGrid Configuration Test")
     print("=" * 50)
     
+    warm_connection(SESSION)
+    
     # Test API key and sender verification
     api_valid = test_sendgrid_api()
     
     if api_valid:
         # If API is valid, test sending an email
-        test_send_email()
+        test_send_email(SESSION)
     else:
         print("\n❌ Cannot test email sending - fix the above issues first.")
         print("\nNext steps:")